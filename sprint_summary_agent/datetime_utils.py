@@ -0,0 +1,18 @@
+"""Timestamp helpers that use ciso8601 when it is installed and fall back to the stdlib."""
+
+from datetime import datetime
+
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, including Jira's "Z"-suffixed UTC form."""
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(value)
+    # fromisoformat only accepts "Z" from Python 3.11
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
@@ -0,0 +1,23 @@
+"""File writing helpers shared by the output generators and the LLM cache."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Union
+
+
+def atomic_write_bytes(path: Path, data: Union[bytes, memoryview]) -> None:
+    """Write data to path through a temp file renamed into place.
+
+    Readers never see a partially written file. The temp name is unique per
+    process and thread, and a plain open() keeps umask-default permissions.
+    The temp file is removed if the write or rename fails.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
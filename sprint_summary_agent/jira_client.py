@@ -1,10 +1,30 @@
 """Jira API v3 Client for interacting with Jira REST API."""
 
 import base64
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import json_utils
+from .datetime_utils import parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent Jira requests; kept below the adapter's pool_maxsize
+MAX_WORKERS = 8
+
+# Issues requested per page when listing sprint issues
+ISSUE_PAGE_SIZE = 100
+
+# Sort key for sprints without an end date, older than any real one
+_MISSING_END_DATE = datetime.min.replace(tzinfo=timezone.utc)
 
 
 class JiraClient:
@@ -21,6 +41,33 @@ class JiraClient:
         self.api_token = config["api_token"]
         self.base_url = f"https://{self.host}/rest/api/3"
         self.agile_url = f"https://{self.host}/rest/agile/1.0"
+        self._auth_header = self._get_auth_header()
+
+        # Per-instance caches so repeated team lookups reuse board/sprint listings
+        self._cache_lock = threading.Lock()
+        self._boards_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._all_boards_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._sprints_cache: Dict[int, List[Dict[str, Any]]] = {}
+        self._sprint_issues_cache: Dict[int, List[Dict[str, Any]]] = {}
+        self._sprint_label_buckets: Dict[int, Dict[str, List[Dict[str, Any]]]] = {}
+
+        # Reuse one pooled session so TCP/TLS handshakes happen once per host
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        )
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries),
+        )
+        self._session.headers.update({
+            "Authorization": self._auth_header,
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        })
 
     def _get_auth_header(self) -> str:
         """Generate Basic Auth header."""
@@ -42,44 +89,84 @@ class JiraClient:
         Raises:
             Exception: If request fails
         """
-        headers = {
-            "Authorization": self._get_auth_header(),
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
-        headers.update(kwargs.pop("headers", {}))
-
-        response = requests.request(method, url, headers=headers, **kwargs)
+        response = self._session.request(method, url, **kwargs)
 
         if not response.ok:
             raise Exception(f"Jira API Error ({response.status_code}): {response.text}")
 
-        return response.json()
+        return json_utils.loads(response.content)
+
+    def get_boards(self, project_key: str, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Get all boards for a project.
+
+        Results are cached per client; pass refresh=True to bypass the cache.
+        """
+        if not refresh:
+            with self._cache_lock:
+                if project_key in self._boards_cache:
+                    return self._boards_cache[project_key]
 
-    def get_boards(self, project_key: str) -> List[Dict[str, Any]]:
-        """Get all boards for a project."""
         url = f"{self.agile_url}/board?projectKeyOrId={project_key}"
         data = self.request(url)
-        return data.get("values", [])
+        boards = data.get("values", [])
 
-    def get_all_boards_for_projects(self, project_keys: List[str]) -> List[Dict[str, Any]]:
+        with self._cache_lock:
+            self._boards_cache[project_key] = boards
+        return boards
+
+    def get_all_boards_for_projects(
+        self, project_keys: List[str], refresh: bool = False
+    ) -> List[Dict[str, Any]]:
         """Get all boards for multiple projects."""
+        cache_key = tuple(project_keys)
+        if not refresh:
+            with self._cache_lock:
+                if cache_key in self._all_boards_cache:
+                    return self._all_boards_cache[cache_key]
+
         all_boards = []
-        for project_key in project_keys:
+        if not project_keys:
+            return all_boards
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(project_keys))) as executor:
+            futures = [
+                executor.submit(self.get_boards, project_key, refresh) for project_key in project_keys
+            ]
+
+        # Collect in submission order so results stay deterministic
+        complete = True
+        for project_key, future in zip(project_keys, futures):
             try:
-                boards = self.get_boards(project_key)
+                boards = future.result()
                 for board in boards:
-                    board["projectKey"] = project_key
-                    all_boards.append(board)
+                    all_boards.append(dict(board, projectKey=project_key))
             except Exception as e:
-                print(f"Warning: Could not fetch boards for project {project_key}: {e}")
+                complete = False
+                logger.warning("Could not fetch boards for project %s: %s", project_key, e)
+
+        # Only memoize full results so a transient failure is retried next time
+        if complete:
+            with self._cache_lock:
+                self._all_boards_cache[cache_key] = all_boards
         return all_boards
 
-    def get_sprints(self, board_id: int) -> List[Dict[str, Any]]:
-        """Get all sprints for a board."""
+    def get_sprints(self, board_id: int, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Get all sprints for a board.
+
+        Results are cached per client; pass refresh=True to bypass the cache.
+        """
+        if not refresh:
+            with self._cache_lock:
+                if board_id in self._sprints_cache:
+                    return self._sprints_cache[board_id]
+
         url = f"{self.agile_url}/board/{board_id}/sprint"
         data = self.request(url)
-        return data.get("values", [])
+        sprints = data.get("values", [])
+
+        with self._cache_lock:
+            self._sprints_cache[board_id] = sprints
+        return sprints
 
     def get_last_closed_sprint_for_team(
         self, project_keys: List[str], team_label: str
@@ -102,22 +189,23 @@ class JiraClient:
             raise Exception(f"No boards found for projects: {', '.join(project_keys)}")
 
         all_matching_sprints = []
+        label_lc = team_label.lower()
 
-        # Search all boards for sprints with the team name
-        for board in all_boards:
-            try:
-                sprints = self.get_sprints(board["id"])
-
-                # Filter for closed sprints with team name in sprint name
-                team_sprints = [
-                    sprint
-                    for sprint in sprints
-                    if sprint.get("state") == "closed"
-                    and team_label.lower() in sprint.get("name", "").lower()
-                ]
+        # Search all boards for sprints with the team name, fetching boards concurrently
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(all_boards))) as executor:
+            futures = [executor.submit(self.get_sprints, board["id"]) for board in all_boards]
 
-                # Add board and project info to each sprint
-                for sprint in team_sprints:
+        for board, future in zip(all_boards, futures):
+            try:
+                sprints = future.result()
+
+                # Keep closed sprints with team name in sprint name, adding board and project info
+                for sprint in sprints:
+                    if sprint.get("state") != "closed":
+                        continue
+                    name = sprint.get("name")
+                    if not name or label_lc not in name.lower():
+                        continue
                     all_matching_sprints.append(
                         {
                             "sprint": sprint,
@@ -127,7 +215,7 @@ class JiraClient:
                         }
                     )
             except Exception as e:
-                print(f"Warning: Could not fetch sprints for board {board['name']}: {e}")
+                logger.warning("Could not fetch sprints for board %s: %s", board["name"], e)
 
         if not all_matching_sprints:
             raise Exception(
@@ -135,11 +223,8 @@ class JiraClient:
                 f"across projects: {', '.join(project_keys)}"
             )
 
-        # Sort by end date to get most recent
-        all_matching_sprints.sort(
-            key=lambda x: datetime.fromisoformat(x["sprint"]["endDate"].replace("Z", "+00:00")),
-            reverse=True,
-        )
+        # Sort by end date to get most recent; missing dates sort last
+        all_matching_sprints.sort(key=lambda x: _sprint_end_date(x["sprint"]), reverse=True)
 
         most_recent = all_matching_sprints[0]
         return {
@@ -177,27 +262,85 @@ class JiraClient:
 
         # If team label provided, try to find sprints matching the team name
         if team_label:
+            label_lc = team_label.lower()
             team_specific_sprints = [
                 sprint
                 for sprint in closed_sprints
-                if team_label.lower() in sprint.get("name", "").lower()
+                if label_lc in (sprint.get("name") or "").lower()
             ]
 
             # If we found team-specific sprints, use those
             if team_specific_sprints:
                 closed_sprints = team_specific_sprints
 
-        # Sort by end date to get most recent
-        closed_sprints.sort(
-            key=lambda x: datetime.fromisoformat(x["endDate"].replace("Z", "+00:00")),
-            reverse=True,
-        )
+        # Sort by end date to get most recent; missing dates sort last
+        closed_sprints.sort(key=_sprint_end_date, reverse=True)
 
         if not closed_sprints:
             raise Exception(f"No closed sprints found for project {project_key}")
 
         return {"sprint": closed_sprints[0], "boardId": board_id, "projectKey": project_key}
 
+    def _fetch_sprint_issues(self, sprint_id: int, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Fetch (and cache) the raw issue list for a sprint."""
+        if not refresh:
+            with self._cache_lock:
+                if sprint_id in self._sprint_issues_cache:
+                    return self._sprint_issues_cache[sprint_id]
+
+        url = f"{self.agile_url}/sprint/{sprint_id}/issue"
+        data = self.request(url, params={"startAt": 0, "maxResults": ISSUE_PAGE_SIZE})
+        issues = list(data.get("issues", []))
+        total = data.get("total", len(issues))
+        page_size = data.get("maxResults") or ISSUE_PAGE_SIZE
+
+        # Once the total is known, fetch the remaining pages concurrently
+        starts = list(range(len(issues), total, page_size)) if issues else []
+        if starts:
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(starts))) as executor:
+                futures = [
+                    executor.submit(self.request, url, params={"startAt": start, "maxResults": page_size})
+                    for start in starts
+                ]
+            for future in futures:
+                issues.extend(future.result().get("issues", []))
+
+        buckets = self.bucket_issues_by_label(issues)
+        with self._cache_lock:
+            self._sprint_issues_cache[sprint_id] = issues
+            self._sprint_label_buckets[sprint_id] = buckets
+        return issues
+
+    def bucket_issues_by_label(
+        self, issues: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Group issues by label in a single pass, preserving issue order per label."""
+        buckets: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for issue in issues:
+            for label in (issue.get("fields") or {}).get("labels") or ():
+                buckets[label].append(issue)
+        return dict(buckets)
+
+    def get_sprint_issues_and_labels(
+        self, sprint_id: int, team_label: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Get sprint issues and the unique labels used in the sprint from one fetch.
+
+        Args:
+            sprint_id: Sprint ID
+            team_label: Optional team label to filter issues by
+
+        Returns:
+            Tuple of (issues, sorted unique labels across all sprint issues)
+        """
+        all_issues = self._fetch_sprint_issues(sprint_id)
+        with self._cache_lock:
+            buckets = self._sprint_label_buckets[sprint_id]
+
+        # Label buckets are built once per sprint, so each team lookup is O(1)
+        issues = list(buckets.get(team_label, ())) if team_label else list(all_issues)
+        return issues, sorted(buckets)
+
     def get_sprint_issues(self, sprint_id: int, team_label: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all issues in a sprint.
 
@@ -208,48 +351,31 @@ class JiraClient:
         Returns:
             List of issues
         """
-        url = f"{self.agile_url}/sprint/{sprint_id}/issue?maxResults=1000"
-        data = self.request(url)
-        issues = data.get("issues", [])
-
-        # Filter by team label if specified
-        if team_label:
-            issues = [
-                issue
-                for issue in issues
-                if issue.get("fields", {}).get("labels")
-                and team_label in issue["fields"]["labels"]
-            ]
-
+        issues, _ = self.get_sprint_issues_and_labels(sprint_id, team_label)
         return issues
 
     def get_team_labels_from_sprint(self, sprint_id: int) -> List[str]:
         """Get unique team labels from sprint issues."""
-        url = f"{self.agile_url}/sprint/{sprint_id}/issue?maxResults=1000"
-        data = self.request(url)
-        labels_set = set()
-
-        for issue in data.get("issues", []):
-            issue_labels = issue.get("fields", {}).get("labels", [])
-            labels_set.update(issue_labels)
-
-        return sorted(labels_set)
+        _, labels = self.get_sprint_issues_and_labels(sprint_id)
+        return labels
 
     def get_sprint_team_members(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Get users assigned to issues in the sprint."""
-        unique_users = {}
+        unique_users: Dict[str, Dict[str, Any]] = {}
 
         for issue in issues:
-            assignee = issue.get("fields", {}).get("assignee")
-            if assignee:
-                account_id = assignee.get("accountId")
-                if account_id and account_id not in unique_users:
-                    unique_users[account_id] = {
-                        "accountId": account_id,
-                        "displayName": assignee.get("displayName", "Unknown"),
-                        "emailAddress": assignee.get("emailAddress", "N/A"),
-                        "avatarUrl": assignee.get("avatarUrls", {}).get("48x48", ""),
-                    }
+            assignee = (issue.get("fields") or {}).get("assignee")
+            if not assignee:
+                continue
+            account_id = assignee.get("accountId")
+            if not account_id or account_id in unique_users:
+                continue
+            unique_users[account_id] = {
+                "accountId": account_id,
+                "displayName": assignee.get("displayName", "Unknown"),
+                "emailAddress": assignee.get("emailAddress", "N/A"),
+                "avatarUrl": (assignee.get("avatarUrls") or {}).get("48x48", ""),
+            }
 
         return list(unique_users.values())
 
@@ -268,4 +394,14 @@ class JiraClient:
         url = f"{self.base_url}/search"
         body = {"jql": jql, "fields": fields, "maxResults": 1000}
 
-        return self.request(url, method="POST", json=body)
+        return self.request(url, method="POST", data=json_utils.dumps(body))
+
+
+def _sprint_end_date(sprint: Dict[str, Any]) -> datetime:
+    """Parse a sprint's end date for sorting.
+
+    Jira returns timestamps in the board's local offset, so they are compared as
+    datetimes rather than strings.
+    """
+    end_date = sprint.get("endDate")
+    return parse_timestamp(end_date) if end_date else _MISSING_END_DATE
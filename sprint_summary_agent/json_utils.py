@@ -0,0 +1,49 @@
+"""JSON helpers that use orjson when it is installed and fall back to the stdlib."""
+
+import json
+import re
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Markdown code fence wrapped around JSON in LLM responses
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Parse JSON from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        pretty: Indent with two spaces instead of producing compact output
+        sort_keys: Sort object keys, giving a canonical encoding for hashing
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys).encode("utf-8")
+
+
+def strip_code_fence(text: str) -> str:
+    """Return the body of a ```json fenced block, or the stripped text if unfenced."""
+    match = _FENCE_RE.match(text)
+    return match.group(1) if match else text.strip()
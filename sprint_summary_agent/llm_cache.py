@@ -0,0 +1,57 @@
+"""On-disk cache for parsed LLM responses, keyed by a hash of the request."""
+
+import hashlib
+import logging
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from . import json_utils
+from .file_utils import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+# Cached responses older than this are treated as misses and regenerated
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+class LLMResponseCache:
+    """Content-addressed JSON file cache so identical prompts skip the LLM call."""
+
+    def __init__(self, cache_dir: str, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS):
+        """Initialize cache rooted at cache_dir (created lazily on first write).
+
+        Args:
+            cache_dir: Directory holding one JSON file per cached response
+            ttl_seconds: Maximum age of a usable entry; None keeps entries forever
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(model: str, prompt: str, max_tokens: int) -> str:
+        """Build a cache key from everything that affects the completion."""
+        payload = f"{model}|{max_tokens}|{prompt}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss or expired entry."""
+        path = self._path(key)
+        try:
+            if self.ttl_seconds is not None and time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            return json_utils.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value; failures only emit a warning."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Concurrent writers of the same key each rename a complete file into place
+            atomic_write_bytes(self._path(key), json_utils.dumps(value))
+        except OSError as e:
+            logger.warning("Could not write LLM cache entry: %s", e)
@@ -1,11 +1,41 @@
 """LLM Provider Abstraction Layer supporting multiple providers."""
 
+import asyncio
+import functools
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
 
 import httpx
-from anthropic import Anthropic
-from openai import OpenAI
+
+from . import json_utils
+
+# The provider SDKs are imported when a provider is created, so only the
+# configured one is loaded
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+    from openai import AsyncOpenAI
+
+try:
+    import h2  # noqa: F401 - presence enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connection pool shared by the sync and async OpenRouter clients; sized for the
+# pipeline's concurrent sprint/slide requests, idle connections kept for a minute
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=8, keepalive_expiry=60.0)
+
+# Seconds between status checks while waiting for a batch job to finish
+BATCH_POLL_INTERVAL = 30
+
+# Seconds to wait for a batch job before cancelling it, matching the providers'
+# 24 hour completion window
+BATCH_TIMEOUT = 24 * 60 * 60
+
+# OpenAI batch statuses after which no further progress is made
+_OPENAI_BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
 
 
 class LLMProvider(ABC):
@@ -15,12 +45,85 @@ class LLMProvider(ABC):
         """Initialize provider with API key and model."""
         self.api_key = api_key
         self.model = model
+        # Async clients keyed by the event loop they are bound to; the lock
+        # guards check-and-create since the shared provider is used from
+        # several threads
+        self._async_clients: Dict[asyncio.AbstractEventLoop, Any] = {}
+        self._async_clients_lock = threading.Lock()
+
+    @abstractmethod
+    def generate_completion(self, prompt: str, max_tokens: int = 2048, json_mode: bool = False) -> str:
+        """Generate completion - must be implemented by subclasses.
+
+        Args:
+            prompt: User prompt
+            max_tokens: Maximum number of tokens to generate
+            json_mode: Ask the provider to constrain output to a JSON object,
+                where the API supports it
+        """
+        pass
+
+    async def generate_completion_async(
+        self, prompt: str, max_tokens: int = 2048, json_mode: bool = False
+    ) -> str:
+        """Generate completion without blocking the event loop.
+
+        Subclasses with a native async client override this; the default runs
+        the blocking call in a worker thread.
+        """
+        return await asyncio.to_thread(self.generate_completion, prompt, max_tokens, json_mode)
+
+    def generate_completion_stream(
+        self, prompt: str, max_tokens: int = 2048, json_mode: bool = False
+    ) -> Iterator[str]:
+        """Yield completion text in chunks as it arrives.
+
+        Subclasses with a streaming API override this; the default yields the
+        whole completion as a single chunk.
+        """
+        yield self.generate_completion(prompt, max_tokens, json_mode)
+
+    def generate_completion_batch(
+        self, prompts: List[str], max_tokens: int = 2048, json_mode: bool = False
+    ) -> List[Optional[str]]:
+        """Generate completions for several prompts as one batch job.
+
+        Subclasses with a batch API override this to submit every prompt at once
+        at reduced cost and block until the job finishes (which can take hours);
+        entries are None for prompts that failed. Jobs still running after
+        BATCH_TIMEOUT are cancelled and raise. The default runs the prompts
+        one after another.
+        """
+        return [self.generate_completion(prompt, max_tokens, json_mode) for prompt in prompts]
 
     @abstractmethod
-    def generate_completion(self, prompt: str, max_tokens: int = 2048) -> str:
-        """Generate completion - must be implemented by subclasses."""
+    def _create_async_client(self) -> Any:
+        """Create the async client used by generate_completion_async - must be implemented by subclasses."""
         pass
 
+    def _get_async_client(self) -> Any:
+        """Return an async client bound to the running event loop.
+
+        Async HTTP clients cannot be shared across event loops, so each loop gets
+        its own client, created on first use and closed by aclose(). Clients of
+        loops that ended without aclose() can no longer be closed and are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                for stale_loop in [other for other in self._async_clients if other.is_closed()]:
+                    del self._async_clients[stale_loop]
+                client = self._async_clients[loop] = self._create_async_client()
+        return client
+
+    async def aclose(self) -> None:
+        """Close the async client bound to the running event loop, if one was created."""
+        with self._async_clients_lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await _close_async_client(client)
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI Provider."""
@@ -28,14 +131,87 @@ class OpenAIProvider(LLMProvider):
     def __init__(self, api_key: str, model: str = "gpt-4o"):
         """Initialize OpenAI provider."""
         super().__init__(api_key, model)
+        from openai import OpenAI
+
         self.client = OpenAI(api_key=api_key)
 
-    def generate_completion(self, prompt: str, max_tokens: int = 2048) -> str:
+    def _request(self, prompt: str, max_tokens: int, json_mode: bool) -> dict:
+        """Build the chat completion request arguments."""
+        request = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+        }
+        if json_mode:
+            request["response_format"] = {"type": "json_object"}
+        return request
+
+    def generate_completion(self, prompt: str, max_tokens: int = 2048, json_mode: bool = False) -> str:
         """Generate completion using OpenAI API."""
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=max_tokens,
+        response = self.client.chat.completions.create(**self._request(prompt, max_tokens, json_mode))
+        return response.choices[0].message.content
+
+    def generate_completion_stream(
+        self, prompt: str, max_tokens: int = 2048, json_mode: bool = False
+    ) -> Iterator[str]:
+        """Stream completion text from the OpenAI API."""
+        stream = self.client.chat.completions.create(**self._request(prompt, max_tokens, json_mode), stream=True)
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def generate_completion_batch(
+        self, prompts: List[str], max_tokens: int = 2048, json_mode: bool = False
+    ) -> List[Optional[str]]:
+        """Run prompts through the OpenAI Batch API and wait for the results."""
+        lines = [
+            json_utils.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._request(prompt, max_tokens, json_mode),
+            })
+            for i, prompt in enumerate(prompts)
+        ]
+        batch_file = self.client.files.create(file=("batch.jsonl", b"\n".join(lines)), purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        deadline = time.monotonic() + BATCH_TIMEOUT
+        while batch.status not in _OPENAI_BATCH_FINAL_STATUSES:
+            if time.monotonic() >= deadline:
+                self.client.batches.cancel(batch.id)
+                raise Exception(f"OpenAI batch {batch.id} did not finish within {BATCH_TIMEOUT} seconds")
+            time.sleep(BATCH_POLL_INTERVAL)
+            batch = self.client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            raise Exception(f"OpenAI batch {batch.id} finished with status {batch.status}")
+
+        results: List[Optional[str]] = [None] * len(prompts)
+        if batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).content
+            for line in output.splitlines():
+                if not line:
+                    continue
+                item = json_utils.loads(line)
+                response = item.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[int(item["custom_id"])] = response["body"]["choices"][0]["message"]["content"]
+        return results
+
+    def _create_async_client(self) -> "AsyncOpenAI":
+        from openai import AsyncOpenAI
+
+        return AsyncOpenAI(api_key=self.api_key)
+
+    async def generate_completion_async(
+        self, prompt: str, max_tokens: int = 2048, json_mode: bool = False
+    ) -> str:
+        """Generate completion using the async OpenAI client."""
+        response = await self._get_async_client().chat.completions.create(
+            **self._request(prompt, max_tokens, json_mode)
         )
         return response.choices[0].message.content
 
@@ -46,10 +222,16 @@ class AnthropicProvider(LLMProvider):
     def __init__(self, api_key: str, model: str = "claude-3-5-sonnet-20241022"):
         """Initialize Anthropic provider."""
         super().__init__(api_key, model)
+        from anthropic import Anthropic
+
         self.client = Anthropic(api_key=api_key)
 
-    def generate_completion(self, prompt: str, max_tokens: int = 2048) -> str:
-        """Generate completion using Anthropic API."""
+    def generate_completion(self, prompt: str, max_tokens: int = 2048, json_mode: bool = False) -> str:
+        """Generate completion using Anthropic API.
+
+        Anthropic has no JSON mode, so json_mode is ignored; prompts that need
+        JSON already ask for it.
+        """
         response = self.client.messages.create(
             model=self.model,
             max_tokens=max_tokens,
@@ -57,6 +239,64 @@ class AnthropicProvider(LLMProvider):
         )
         return response.content[0].text
 
+    def generate_completion_stream(
+        self, prompt: str, max_tokens: int = 2048, json_mode: bool = False
+    ) -> Iterator[str]:
+        """Stream completion text from the Anthropic API."""
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        ) as stream:
+            yield from stream.text_stream
+
+    def generate_completion_batch(
+        self, prompts: List[str], max_tokens: int = 2048, json_mode: bool = False
+    ) -> List[Optional[str]]:
+        """Run prompts through the Anthropic Message Batches API and wait for the results."""
+        batch = self.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": str(i),
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": max_tokens,
+                        "messages": [{"role": "user", "content": prompt}],
+                    },
+                }
+                for i, prompt in enumerate(prompts)
+            ]
+        )
+        deadline = time.monotonic() + BATCH_TIMEOUT
+        while batch.processing_status != "ended":
+            if time.monotonic() >= deadline:
+                self.client.messages.batches.cancel(batch.id)
+                raise Exception(f"Anthropic batch {batch.id} did not finish within {BATCH_TIMEOUT} seconds")
+            time.sleep(BATCH_POLL_INTERVAL)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        results: List[Optional[str]] = [None] * len(prompts)
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[int(entry.custom_id)] = entry.result.message.content[0].text
+        return results
+
+    def _create_async_client(self) -> "AsyncAnthropic":
+        from anthropic import AsyncAnthropic
+
+        return AsyncAnthropic(api_key=self.api_key)
+
+    async def generate_completion_async(
+        self, prompt: str, max_tokens: int = 2048, json_mode: bool = False
+    ) -> str:
+        """Generate completion using the async Anthropic client."""
+        response = await self._get_async_client().messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        return response.content[0].text
+
 
 class OpenRouterProvider(LLMProvider):
     """OpenRouter Provider."""
@@ -65,39 +305,106 @@ class OpenRouterProvider(LLMProvider):
         """Initialize OpenRouter provider."""
         super().__init__(api_key, model)
         self.base_url = "https://openrouter.ai/api/v1"
+        # Long-lived client so keep-alive connections and TLS sessions are reused
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            headers=self._headers(),
+            timeout=60.0,
+            http2=HTTP2_AVAILABLE,
+            limits=_HTTP_LIMITS,
+        )
 
-    def generate_completion(self, prompt: str, max_tokens: int = 2048) -> str:
-        """Generate completion using OpenRouter API."""
-        headers = {
+    def close(self):
+        """Close the underlying HTTP client."""
+        self._client.close()
+
+    def __del__(self):
+        client = getattr(self, "_client", None)
+        if client is not None:
+            client.close()
+
+    def _headers(self) -> dict:
+        """Build request headers for the OpenRouter API."""
+        return {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}",
             "HTTP-Referer": "https://github.com/yourusername/sprint-summary-agent",
             "X-Title": "Sprint Summary Agent",
         }
 
-        data = {
+    def _payload(self, prompt: str, max_tokens: int, json_mode: bool = False) -> dict:
+        """Build the chat completion request body."""
+        payload = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
             "max_tokens": max_tokens,
         }
+        if json_mode:
+            # Forwarded to models that support it; OpenRouter drops it for the rest
+            payload["response_format"] = {"type": "json_object"}
+        return payload
 
-        with httpx.Client() as client:
-            response = client.post(
-                f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=60.0,
-            )
+    def generate_completion(self, prompt: str, max_tokens: int = 2048, json_mode: bool = False) -> str:
+        """Generate completion using OpenRouter API."""
+        response = self._client.post(
+            "/chat/completions",
+            content=json_utils.dumps(self._payload(prompt, max_tokens, json_mode)),
+        )
+        response.raise_for_status()
+        result = json_utils.loads(response.content)
+        return result["choices"][0]["message"]["content"]
+
+    def generate_completion_stream(
+        self, prompt: str, max_tokens: int = 2048, json_mode: bool = False
+    ) -> Iterator[str]:
+        """Stream completion text from the OpenRouter API (server-sent events)."""
+        payload = dict(self._payload(prompt, max_tokens, json_mode), stream=True)
+        with self._client.stream("POST", "/chat/completions", content=json_utils.dumps(payload)) as response:
             response.raise_for_status()
-            result = response.json()
-            return result["choices"][0]["message"]["content"]
+            for line in response.iter_lines():
+                # Skip blank separators and ": OPENROUTER PROCESSING" keep-alive comments
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:]
+                if data == "[DONE]":
+                    break
+                choices = json_utils.loads(data).get("choices") or [{}]
+                content = choices[0].get("delta", {}).get("content")
+                if content:
+                    yield content
+
+    def _create_async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._headers(),
+            timeout=60.0,
+            http2=HTTP2_AVAILABLE,
+            limits=_HTTP_LIMITS,
+        )
+
+    async def generate_completion_async(
+        self, prompt: str, max_tokens: int = 2048, json_mode: bool = False
+    ) -> str:
+        """Generate completion using a pooled async HTTP client."""
+        response = await self._get_async_client().post(
+            "/chat/completions",
+            content=json_utils.dumps(self._payload(prompt, max_tokens, json_mode)),
+        )
+        response.raise_for_status()
+        result = json_utils.loads(response.content)
+        return result["choices"][0]["message"]["content"]
 
 
+@functools.lru_cache(maxsize=None)
 def create_llm_provider(
     provider_name: str, api_key: Optional[str], model: Optional[str]
 ) -> Optional[LLMProvider]:
     """Factory function to create LLM provider based on config.
 
+    Providers are memoized per (provider_name, api_key, model), so every
+    generator built from the same configuration shares one client and its
+    connection pool.
+
     Args:
         provider_name: Name of provider (openai, anthropic, openrouter)
         api_key: API key for the provider
@@ -149,3 +456,9 @@ def get_recommended_models() -> dict:
             "meta-llama/llama-3.1-70b-instruct",
         ],
     }
+
+
+async def _close_async_client(client: Any) -> None:
+    """Close an httpx.AsyncClient (aclose) or an async SDK client (close)."""
+    close = getattr(client, "aclose", None) or client.close
+    await close()
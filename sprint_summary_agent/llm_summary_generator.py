@@ -1,42 +1,455 @@
 """LLM-based Summary Generator for presentation slides."""
 
+import io
 import json
-from typing import Any, Dict, List, Optional
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+from pydantic import BaseModel
+
+from . import json_utils
+from .llm_cache import LLMResponseCache
 from .llm_provider import LLMProvider, create_llm_provider
+from .llm_recommendations import (
+    PROMPT_MAX_ACCOMPLISHMENTS,
+    PROMPT_MAX_BLOCKERS,
+    generate_fallback_recommendations,
+    normalize_recommendations,
+)
+
+logger = logging.getLogger(__name__)
+
+_SLIDE_INTRO = (
+    "You are an expert Agile coach creating a concise, executive-level sprint summary for a "
+    "presentation slide. Generate content for a 2x2 grid layout with four sections."
+)
+
+_SLIDE_SECTIONS = """1. **Sprint Health Summary** (Top Left): A concise narrative summary (3-4 bullet points, max 50 chars each) highlighting:
+   - Overall sprint health with key metrics
+   - Completion rate and velocity achievement
+   - Any critical concerns or wins
+
+2. **Key Accomplishments** (Top Right): Narrative highlights (3-5 bullet points, max 45 chars each):
+   - Most impactful completed work
+   - Focus on business value and outcomes
+   - Group similar items if helpful
+
+3. **Blockers & Risks** (Bottom Left): Current challenges (3-4 bullet points, max 45 chars each):
+   - Active blockers with priority context
+   - If no blockers, highlight what's keeping momentum
+   - Be specific but concise
+
+4. **Recommendations** (Bottom Right): Actionable next steps (3-4 bullet points, max 55 chars each):
+   - Prioritized recommendations (High/Medium/Low)
+   - Focus on what will improve next sprint
+   - Be specific and actionable"""
+
+_SLIDE_SCHEMA = """{
+  "healthSummary": {
+    "title": "Sprint Health Metrics",
+    "bullets": ["bullet 1", "bullet 2", "bullet 3"]
+  },
+  "accomplishments": {
+    "title": "Key Accomplishments",
+    "bullets": ["bullet 1", "bullet 2", "bullet 3"]
+  },
+  "blockers": {
+    "title": "Blockers & Risks",
+    "bullets": ["bullet 1", "bullet 2", "bullet 3"]
+  },
+  "recommendations": {
+    "title": "Recommendations",
+    "bullets": ["[High] bullet 1", "[Medium] bullet 2"]
+  }
+}"""
+
+_COMPACT_JSON = "Return compact JSON with no whitespace or newlines between tokens."
+
+_BULLET_GUIDANCE = (
+    "Keep all bullets concise and within character limits. Use active voice. "
+    "Focus on insights, not just data."
+)
+
+# Static instructions are placed before the per-sprint data so providers with
+# prompt prefix caching can reuse them across every sprint in a run
+_SLIDE_PROMPT_PREFIX = f"""{_SLIDE_INTRO}
+
+Generate content for a 2x2 slide layout in JSON format with these four sections:
+
+{_SLIDE_SECTIONS}
+
+Return ONLY this JSON structure:
+
+{_SLIDE_SCHEMA}
+
+{_BULLET_GUIDANCE}
+
+{_COMPACT_JSON}
+
+Base the content on this sprint data:"""
+
+_RECOMMENDATIONS_GUIDANCE = (
+    "3-5 recommendations prioritized by impact (High/Medium/Low). "
+    "Focus on actionable insights specific to this team's performance."
+)
+
+_RECOMMENDATIONS_SCHEMA = """[
+    {
+      "category": "Category name (e.g., Velocity, Blockers, WIP Limit, Sprint Planning, Team Health, etc.)",
+      "priority": "High|Medium|Low",
+      "recommendation": "Specific, actionable recommendation"
+    }
+  ]"""
+
+_COMBINED_PROMPT_PREFIX = f"""{_SLIDE_INTRO} Also produce actionable recommendations for the team.
+
+Generate both parts in a single JSON object:
+
+A. **recommendations**: {_RECOMMENDATIONS_GUIDANCE}
+
+B. **slide**: content for a 2x2 slide layout with these four sections:
+
+{_SLIDE_SECTIONS}
+
+Return ONLY this JSON structure:
+
+{{
+  "recommendations": {_RECOMMENDATIONS_SCHEMA},
+  "slide": {_SLIDE_SCHEMA}
+}}
+
+{_BULLET_GUIDANCE}
+
+{_COMPACT_JSON}
+
+Base the content on this sprint data:"""
+
+# Used when no presentation is generated, so no slide content is requested
+_RECOMMENDATIONS_PROMPT_PREFIX = f"""You are an expert Agile coach analyzing a sprint retrospective. Generate {_RECOMMENDATIONS_GUIDANCE}
+
+Return ONLY this JSON structure:
+
+{{
+  "recommendations": {_RECOMMENDATIONS_SCHEMA}
+}}
+
+{_COMPACT_JSON}
+
+Base the recommendations on this sprint data:"""
+
+# Defaults for values missing from the metrics and sprint info used in prompts
+_METRIC_DEFAULTS = {
+    "durationDays": 0,
+    "completedIssues": 0,
+    "totalIssues": 0,
+    "completionRate": 0,
+    "velocity": 0,
+    "velocityPercentage": 0,
+    "totalStoryPoints": 0,
+    "inProgressIssues": 0,
+    "todoIssues": 0,
+    "blockedIssues": 0,
+}
+_SPRINT_DEFAULTS = {"name": "Unknown", "goal": "No goal set"}
+
+# Per-sprint data section; filled in with str.format_map so only the small
+# variable sections are built on each call
+_CONTEXT_TEMPLATE = """**Sprint Context:**
+- Team: {team}
+- Project: {project}
+- Sprint: {sprint[name]}
+- Sprint Goal: {sprint[goal]}
+- Duration: {m[durationDays]} days
+
+**Sprint Metrics:**
+- Overall Health: {overall_health}
+- Completed Issues: {m[completedIssues]}/{m[totalIssues]} ({m[completionRate]}%)
+- Velocity: {m[velocity]} points ({m[velocityPercentage]}% of planned {m[totalStoryPoints]})
+- In Progress: {m[inProgressIssues]}
+- Not Started: {m[todoIssues]}
+- Blocked: {m[blockedIssues]}
+
+**Health Indicators:**
+{health_indicators}
+
+**Top Blockers:**
+{blockers}
+
+**Key Accomplishments:**
+{accomplishments}"""
+
+# Completion budgets for slide-only, recommendations-only and combined
+# recommendations + slide requests (compact JSON keeps all of them well under
+# these; truncated responses are retried once with twice the budget)
+SLIDE_MAX_TOKENS = 512
+RECOMMENDATIONS_MAX_TOKENS = 512
+COMBINED_MAX_TOKENS = 1024
+
+# Decodes the leading JSON value of a response that has more text after it
+_JSON_DECODER = json.JSONDecoder()
+
+# JSON keywords a response cut off mid-token can end with a prefix of
+_JSON_LITERALS = ("true", "false", "null")
+
+
+class SlideSection(BaseModel):
+    """One quadrant of the 2x2 team slide."""
+
+    title: str
+    bullets: List[str]
+
+
+class SlideContent(BaseModel):
+    """Slide content returned by the LLM; parsed and validated in one pass."""
+
+    healthSummary: SlideSection
+    accomplishments: SlideSection
+    blockers: SlideSection
+    recommendations: SlideSection
+
+
+class RecommendationsContent(BaseModel):
+    """Recommendations returned by a recommendations-only request."""
+
+    recommendations: List[Dict[str, Any]]
+
+
+class CombinedContent(RecommendationsContent):
+    """Recommendations and slide content returned by a single combined request."""
+
+    slide: SlideContent
 
 
 class LLMSummaryGenerator:
     """Generate narrative sprint summaries for presentation slides using LLM."""
 
-    def __init__(self, provider: str, api_key: Optional[str], model: Optional[str]):
-        """Initialize with LLM provider configuration."""
+    def __init__(
+        self,
+        provider: str,
+        api_key: Optional[str],
+        model: Optional[str],
+        cache_dir: Optional[str] = None,
+    ):
+        """Initialize with LLM provider configuration.
+
+        Args:
+            provider: LLM provider name
+            api_key: API key for the provider
+            model: Model name to use
+            cache_dir: Optional directory for caching responses to identical prompts
+        """
         self.llm_provider = create_llm_provider(provider, api_key, model)
+        self.cache = LLMResponseCache(cache_dir) if cache_dir else None
 
-    def generate_slide_content(self, summary: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate complete slide content using configured LLM provider."""
-        # Extract data from summary
-        sprint_info = summary.get("sprintInfo", {})
-        project_info = summary.get("projectInfo", {})
-        team_info = summary.get("teamInfo", {})
-        metrics = summary.get("sprintHealthMetrics", {})
-        health_analysis = summary.get("sprintHealthAnalysis", {})
-        blockers = summary.get("currentBlockers", [])
-        accomplishments = summary.get("keyAccomplishments", [])
+    def generate_slide_content(self, summary: Dict[str, Any], use_cache: bool = True) -> Dict[str, Any]:
+        """Generate complete slide content using configured LLM provider.
 
-        if not self.llm_provider:
-            return self._generate_fallback_content(metrics, health_analysis, blockers, accomplishments)
+        Args:
+            summary: Sprint summary dictionary
+            use_cache: Reuse a cached response for an identical prompt; pass False
+                for sprints that are still in progress
 
-        prompt = self._build_prompt(
-            sprint_info, project_info, team_info, metrics, health_analysis, blockers, accomplishments
+        Returns:
+            Slide content dictionary with the four 2x2 sections
+        """
+        # Without a provider, or for an empty sprint, the rule-based content is used as is
+        prompt = self._slide_prompt(summary)
+        if prompt is None:
+            return self._slide_fallback(summary)
+
+        cache_key, cached = self._lookup_cache(prompt, SLIDE_MAX_TOKENS, use_cache)
+        if cached is not None:
+            return cached
+
+        try:
+            text = self._complete(prompt, SLIDE_MAX_TOKENS)
+            content = self._parse_slide_content(text)
+        except Exception as e:
+            logger.warning("Error generating LLM slide content: %s", e)
+            return self._slide_fallback(summary)
+
+        self._store_cache(cache_key, content)
+        return content
+
+    def generate_slide_contents_batch(
+        self, summaries: List[Dict[str, Any]], use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Generate slide content for many summaries with one provider batch job.
+
+        Batch APIs are cheaper but can take hours to return, so this suits
+        scheduled, non-interactive runs. Summaries that need no LLM call or hit
+        the cache are resolved up front; entries the batch fails to produce fall
+        back to rule-based content.
+
+        Args:
+            summaries: Sprint summary dictionaries
+            use_cache: Reuse cached responses for identical prompts
+
+        Returns:
+            Slide content dictionaries, in the same order as summaries
+        """
+        contents: List[Optional[Dict[str, Any]]] = []
+        pending: List[Tuple[int, str, Optional[str]]] = []
+        for i, summary in enumerate(summaries):
+            prompt = self._slide_prompt(summary)
+            if prompt is None:
+                contents.append(self._slide_fallback(summary))
+                continue
+            cache_key, cached = self._lookup_cache(prompt, SLIDE_MAX_TOKENS, use_cache)
+            contents.append(cached)
+            if cached is None:
+                pending.append((i, prompt, cache_key))
+
+        if not pending:
+            return contents
+
+        try:
+            texts = self.llm_provider.generate_completion_batch(
+                [prompt for _, prompt, _ in pending], SLIDE_MAX_TOKENS, json_mode=True
+            )
+        except Exception as e:
+            logger.warning("Error running LLM slide content batch: %s", e)
+            texts = [None] * len(pending)
+
+        for (i, _, cache_key), text in zip(pending, texts):
+            if text is None:
+                contents[i] = self._slide_fallback(summaries[i])
+                continue
+            try:
+                content = self._parse_slide_content(text)
+            except Exception:
+                # Already logged by _parse_slide_content
+                contents[i] = self._slide_fallback(summaries[i])
+                continue
+            self._store_cache(cache_key, content)
+            contents[i] = content
+        return contents
+
+    async def generate_recommendations_and_slides_async(
+        self,
+        metrics: Dict[str, Any],
+        health_analysis: Dict[str, Any],
+        sprint_info: Dict[str, Any],
+        project_info: Dict[str, Any],
+        team_info: Dict[str, Any],
+        blockers: List[Dict[str, Any]],
+        accomplishments: List[Dict[str, Any]],
+        use_cache: bool = True,
+        include_slide: bool = True,
+    ) -> Dict[str, Any]:
+        """Generate recommendations and slide content for a sprint with a single LLM call.
+
+        Sharing one prompt avoids sending the same sprint context twice and halves
+        the number of round trips per team. The call is async so sprints can be
+        fanned out concurrently.
+
+        Args:
+            use_cache: Reuse a cached response for an identical prompt
+            include_slide: Also generate slide content; pass False when no
+                presentation is built so only recommendations are requested
+
+        Returns:
+            Dictionary with "recommendations" (list), "slide" (2x2 slide content,
+            None without include_slide) and "generatedByLLM" (False when the
+            rule-based fallback was used)
+        """
+        # Without a provider, or for an empty sprint, the rule-based content is used as is
+        if not self.llm_provider or _is_empty_sprint(metrics, blockers, accomplishments):
+            return self._generate_fallback_bundle(metrics, health_analysis, blockers, accomplishments, include_slide)
+
+        prompt = self._build_combined_prompt(
+            sprint_info,
+            project_info,
+            team_info,
+            metrics,
+            health_analysis,
+            blockers[:PROMPT_MAX_BLOCKERS],
+            accomplishments[:PROMPT_MAX_ACCOMPLISHMENTS],
+            include_slide,
         )
+        max_tokens = COMBINED_MAX_TOKENS if include_slide else RECOMMENDATIONS_MAX_TOKENS
+
+        cache_key, cached = self._lookup_cache(prompt, max_tokens, use_cache)
+        if cached is not None:
+            return {**cached, "generatedByLLM": True}
 
         try:
-            text = self.llm_provider.generate_completion(prompt, 2048)
-            return self._parse_slide_content(text)
+            text = await self._complete_async(prompt, max_tokens)
+            content = self._parse_combined_content(text, include_slide)
         except Exception as e:
-            print(f"Error generating LLM slide content: {e}")
-            return self._generate_fallback_content(metrics, health_analysis, blockers, accomplishments)
+            logger.warning("Error generating LLM recommendations and slide content: %s", e)
+            return self._generate_fallback_bundle(metrics, health_analysis, blockers, accomplishments, include_slide)
+
+        self._store_cache(cache_key, content)
+        return {**content, "generatedByLLM": True}
+
+    async def aclose(self) -> None:
+        """Close the provider's async client for the running event loop."""
+        if self.llm_provider:
+            await self.llm_provider.aclose()
+
+    def _complete(self, prompt: str, max_tokens: int) -> str:
+        """Stream a completion and join the chunks once it finishes.
+
+        Streaming keeps the connection active during long generations, so the
+        per-read timeout applies between chunks rather than to the whole response.
+        A response cut off at max_tokens is retried once with twice the budget.
+        Providers that support it are asked for a JSON object response.
+        """
+        text = "".join(self.llm_provider.generate_completion_stream(prompt, max_tokens, json_mode=True))
+        if _looks_truncated(text):
+            logger.info("LLM response looks truncated at %d tokens, retrying", max_tokens)
+            text = "".join(self.llm_provider.generate_completion_stream(prompt, max_tokens * 2, json_mode=True))
+        return text
+
+    async def _complete_async(self, prompt: str, max_tokens: int) -> str:
+        """Async counterpart of _complete using the provider's async client."""
+        text = await self.llm_provider.generate_completion_async(prompt, max_tokens, json_mode=True)
+        if _looks_truncated(text):
+            logger.info("LLM response looks truncated at %d tokens, retrying", max_tokens)
+            text = await self.llm_provider.generate_completion_async(prompt, max_tokens * 2, json_mode=True)
+        return text
+
+    def _lookup_cache(
+        self, prompt: str, max_tokens: int, use_cache: bool
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return (cache key, cached content) for a prompt; the key is None when caching is off."""
+        if not (self.cache and use_cache):
+            return None, None
+        cache_key = LLMResponseCache.make_key(self.llm_provider.model, prompt, max_tokens)
+        return cache_key, self.cache.get(cache_key)
+
+    def _store_cache(self, cache_key: Optional[str], content: Dict[str, Any]) -> None:
+        """Store parsed content under cache_key, if caching is on."""
+        if cache_key:
+            self.cache.set(cache_key, content)
+
+    def _slide_prompt(self, summary: Dict[str, Any]) -> Optional[str]:
+        """Build the slide prompt for a summary, or None when no LLM call is needed."""
+        metrics = summary.get("sprintHealthMetrics", {})
+        blockers = summary.get("currentBlockers", [])
+        accomplishments = summary.get("keyAccomplishments", [])
+        if not self.llm_provider or _is_empty_sprint(metrics, blockers, accomplishments):
+            return None
+
+        return self._build_prompt(
+            summary.get("sprintInfo", {}),
+            summary.get("projectInfo", {}),
+            summary.get("teamInfo", {}),
+            metrics,
+            summary.get("sprintHealthAnalysis", {}),
+            blockers[:PROMPT_MAX_BLOCKERS],
+            accomplishments[:PROMPT_MAX_ACCOMPLISHMENTS],
+        )
+
+    def _slide_fallback(self, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Rule-based slide content for a summary."""
+        return self._generate_fallback_content(
+            summary.get("sprintHealthMetrics", {}),
+            summary.get("sprintHealthAnalysis", {}),
+            summary.get("currentBlockers", []),
+            summary.get("keyAccomplishments", []),
+        )
 
     def _build_prompt(
         self,
@@ -49,115 +462,123 @@ class LLMSummaryGenerator:
         accomplishments: List[Dict[str, Any]],
     ) -> str:
         """Build the prompt for LLM."""
-        health_indicators_text = "\n".join(
-            [f"- {i['indicator']}: {i['status']} - {i['message']}" for i in health_analysis['healthIndicators']]
+        context = self._build_context(
+            sprint_info, project_info, team_info, metrics, health_analysis, blockers, accomplishments
         )
 
-        blockers_text = "\n".join(
-            [f"- [{b['priority']}] {b['key']}: {b['summary']}" for b in blockers[:3]]
-        ) if blockers else "- No blockers"
+        return f"{_SLIDE_PROMPT_PREFIX}\n\n{context}"
 
-        accomplishments_text = "\n".join(
-            [f"- {a['key']}: {a['summary']}" for a in accomplishments[:5]]
+    def _build_combined_prompt(
+        self,
+        sprint_info: Dict[str, Any],
+        project_info: Dict[str, Any],
+        team_info: Dict[str, Any],
+        metrics: Dict[str, Any],
+        health_analysis: Dict[str, Any],
+        blockers: List[Dict[str, Any]],
+        accomplishments: List[Dict[str, Any]],
+        include_slide: bool = True,
+    ) -> str:
+        """Build a single prompt asking for recommendations and, optionally, slide content together."""
+        context = self._build_context(
+            sprint_info, project_info, team_info, metrics, health_analysis, blockers, accomplishments
         )
 
-        return f"""You are an expert Agile coach creating a concise, executive-level sprint summary for a presentation slide. Generate content for a 2x2 grid layout with four sections.
+        prefix = _COMBINED_PROMPT_PREFIX if include_slide else _RECOMMENDATIONS_PROMPT_PREFIX
+        return f"{prefix}\n\n{context}"
 
-**Sprint Context:**
-- Team: {team_info.get('label', 'Unknown')}
-- Project: {project_info.get('name', 'Unknown')}
-- Sprint: {sprint_info.get('name', 'Unknown')}
-- Sprint Goal: {sprint_info.get('goal', 'No goal set')}
-- Duration: {metrics.get('durationDays', 0)} days
-
-**Sprint Metrics:**
-- Overall Health: {health_analysis.get('overallHealth', 'Unknown')}
-- Completed Issues: {metrics.get('completedIssues', 0)}/{metrics.get('totalIssues', 0)} ({metrics.get('completionRate', 0)}%)
-- Velocity: {metrics.get('velocity', 0)} points ({metrics.get('velocityPercentage', 0)}% of planned {metrics.get('totalStoryPoints', 0)})
-- In Progress: {metrics.get('inProgressIssues', 0)}
-- Not Started: {metrics.get('todoIssues', 0)}
-- Blocked: {metrics.get('blockedIssues', 0)}
-
-**Health Indicators:**
-{health_indicators_text}
-
-**Top Blockers:**
-{blockers_text}
-
-**Key Accomplishments:**
-{accomplishments_text}
-
-Generate content for a 2x2 slide layout in JSON format with these four sections:
-
-1. **Sprint Health Summary** (Top Left): A concise narrative summary (3-4 bullet points, max 50 chars each) highlighting:
-   - Overall sprint health with key metrics
-   - Completion rate and velocity achievement
-   - Any critical concerns or wins
-
-2. **Key Accomplishments** (Top Right): Narrative highlights (3-5 bullet points, max 45 chars each):
-   - Most impactful completed work
-   - Focus on business value and outcomes
-   - Group similar items if helpful
-
-3. **Blockers & Risks** (Bottom Left): Current challenges (3-4 bullet points, max 45 chars each):
-   - Active blockers with priority context
-   - If no blockers, highlight what's keeping momentum
-   - Be specific but concise
+    def _build_context(
+        self,
+        sprint_info: Dict[str, Any],
+        project_info: Dict[str, Any],
+        team_info: Dict[str, Any],
+        metrics: Dict[str, Any],
+        health_analysis: Dict[str, Any],
+        blockers: List[Dict[str, Any]],
+        accomplishments: List[Dict[str, Any]],
+    ) -> str:
+        """Build the per-sprint data section appended to the slide and combined prompts.
 
-4. **Recommendations** (Bottom Right): Actionable next steps (3-4 bullet points, max 55 chars each):
-   - Prioritized recommendations (High/Medium/Low)
-   - Focus on what will improve next sprint
-   - Be specific and actionable
+        Callers pass blockers and accomplishments already cut to the prompt limits.
+        """
+        health_indicators_text = _join_lines(
+            f"- {i['indicator']}: {i['status']} - {i['message']}" for i in health_analysis["healthIndicators"]
+        )
 
-Return ONLY this JSON structure:
+        blockers_text = _join_lines(
+            f"- [{b['priority']}] {b['key']}: {b['summary']}" for b in blockers
+        ) if blockers else "- No blockers"
 
-{{
-  "healthSummary": {{
-    "title": "Sprint Health Metrics",
-    "bullets": ["bullet 1", "bullet 2", "bullet 3"]
-  }},
-  "accomplishments": {{
-    "title": "Key Accomplishments",
-    "bullets": ["bullet 1", "bullet 2", "bullet 3"]
-  }},
-  "blockers": {{
-    "title": "Blockers & Risks",
-    "bullets": ["bullet 1", "bullet 2", "bullet 3"]
-  }},
-  "recommendations": {{
-    "title": "Recommendations",
-    "bullets": ["[High] bullet 1", "[Medium] bullet 2"]
-  }}
-}}
+        accomplishments_text = _join_lines(
+            f"- {a['key']}: {a['summary']}" for a in accomplishments
+        )
 
-Keep all bullets concise and within character limits. Use active voice. Focus on insights, not just data."""
+        # Merge defaults once instead of a .get() per placeholder
+        m = {**_METRIC_DEFAULTS, **metrics}
+        sprint = {**_SPRINT_DEFAULTS, **sprint_info}
+        overall_health = health_analysis.get("overallHealth", "Unknown")
+
+        return _CONTEXT_TEMPLATE.format_map({
+            "team": team_info.get("label", "Unknown"),
+            "project": project_info.get("name", "Unknown"),
+            "sprint": sprint,
+            "m": m,
+            "overall_health": overall_health,
+            "health_indicators": health_indicators_text,
+            "blockers": blockers_text,
+            "accomplishments": accomplishments_text,
+        })
 
     def _parse_slide_content(self, response: str) -> Dict[str, Any]:
         """Parse LLM response into structured slide content."""
         try:
-            # Remove markdown code blocks if present
-            cleaned = response.strip()
-            if cleaned.startswith("```json"):
-                cleaned = cleaned[7:]
-            if cleaned.startswith("```"):
-                cleaned = cleaned[3:]
-            if cleaned.endswith("```"):
-                cleaned = cleaned[:-3]
-            cleaned = cleaned.strip()
-
-            content = json.loads(cleaned)
-
-            # Validate structure
-            required_keys = ["healthSummary", "accomplishments", "blockers", "recommendations"]
-            if not all(key in content for key in required_keys):
-                raise ValueError("Invalid content structure")
-
-            return content
+            cleaned = json_utils.strip_code_fence(response)
+            return SlideContent.model_validate_json(cleaned).model_dump()
         except Exception as e:
-            print(f"Error parsing LLM slide content: {e}")
-            print(f"Raw response: {response}")
+            logger.warning("Error parsing LLM slide content: %s", e)
+            logger.debug("Raw response: %s", response)
             raise
 
+    def _parse_combined_content(self, response: str, include_slide: bool = True) -> Dict[str, Any]:
+        """Parse a combined LLM response into recommendations and slide content.
+
+        Without include_slide the response only holds recommendations and "slide" is None.
+        """
+        try:
+            cleaned = json_utils.strip_code_fence(response)
+            if not include_slide:
+                content = RecommendationsContent.model_validate_json(cleaned)
+                return {"recommendations": normalize_recommendations(content.recommendations), "slide": None}
+            content = CombinedContent.model_validate_json(cleaned)
+            return {
+                "recommendations": normalize_recommendations(content.recommendations),
+                "slide": content.slide.model_dump(),
+            }
+        except Exception as e:
+            logger.warning("Error parsing combined LLM response: %s", e)
+            logger.debug("Raw response: %s", response)
+            raise
+
+    def _generate_fallback_bundle(
+        self,
+        metrics: Dict[str, Any],
+        health_analysis: Dict[str, Any],
+        blockers: List[Dict[str, Any]],
+        accomplishments: List[Dict[str, Any]],
+        include_slide: bool = True,
+    ) -> Dict[str, Any]:
+        """Rule-based recommendations and slide content when the LLM is unavailable."""
+        slide = (
+            self._generate_fallback_content(metrics, health_analysis, blockers, accomplishments)
+            if include_slide
+            else None
+        )
+        return {
+            "recommendations": generate_fallback_recommendations(metrics),
+            "slide": slide,
+            "generatedByLLM": False,
+        }
+
     def _generate_fallback_content(
         self,
         metrics: Dict[str, Any],
@@ -166,16 +587,18 @@ Keep all bullets concise and within character limits. Use active voice. Focus on
         accomplishments: List[Dict[str, Any]],
     ) -> Dict[str, Any]:
         """Fallback to structured data if LLM fails."""
+        blocked = metrics.get("blockedIssues", 0)
+        todo = metrics.get("todoIssues", 0)
+
         health_bullets = [
             f"Health: {health_analysis.get('overallHealth', 'Unknown')}",
             f"Done: {metrics.get('completedIssues', 0)}/{metrics.get('totalIssues', 0)} ({metrics.get('completionRate', 0)}%)",
             f"Velocity: {metrics.get('velocity', 0)} issues",
-            f"Blocked: {metrics.get('blockedIssues', 0)}",
+            f"Blocked: {blocked}",
         ]
 
         accomplishment_bullets = [
-            f"{a['key']}: {a['summary'][:38]}{'...' if len(a['summary']) > 38 else ''}"
-            for a in accomplishments[:4]
+            f"{a['key']}: {_truncate(a['summary'], 38)}" for a in accomplishments[:4]
         ]
 
         blocker_bullets = (
@@ -185,18 +608,18 @@ Keep all bullets concise and within character limits. Use active voice. Focus on
         )
 
         recommendation_bullets = []
-        if metrics.get("velocityPercentage", 0) < 80:
+        if _percent_value(metrics.get("velocityPercentage", 0)) < 80:
             recommendation_bullets.append("[High] Review sprint capacity")
         else:
             recommendation_bullets.append("[Low] Maintain velocity")
 
-        if metrics.get("blockedIssues", 0) > 0:
-            recommendation_bullets.append(f"[High] Clear {metrics['blockedIssues']} blockers")
+        if blocked > 0:
+            recommendation_bullets.append(f"[High] Clear {blocked} blockers")
         else:
             recommendation_bullets.append("[Low] Keep momentum")
 
-        if metrics.get("todoIssues", 0) > 0:
-            recommendation_bullets.append(f"[Medium] Review {metrics['todoIssues']} unstarted")
+        if todo > 0:
+            recommendation_bullets.append(f"[Medium] Review {todo} unstarted")
         else:
             recommendation_bullets.append("[Low] Good planning")
 
@@ -218,3 +641,58 @@ Keep all bullets concise and within character limits. Use active voice. Focus on
                 "bullets": recommendation_bullets[:4],
             },
         }
+
+
+def _join_lines(lines: Iterable[str]) -> str:
+    """Join lines with newlines in a single buffer, without building a list first."""
+    buf = io.StringIO()
+    for line in lines:
+        buf.write(line)
+        buf.write("\n")
+    return buf.getvalue()[:-1]
+
+
+def _looks_truncated(response: str) -> bool:
+    """Return True if a JSON object response ends before the object is complete.
+
+    Only a response cut off mid-object is worth retrying with a larger budget;
+    prose, malformed JSON or text around a complete object are left to the
+    parser's fallback.
+    """
+    payload = json_utils.strip_code_fence(response)
+    start = payload.find("{")
+    if start < 0:
+        return False
+    try:
+        _JSON_DECODER.raw_decode(payload, start)
+    except json.JSONDecodeError as e:
+        # A cut-off object fails at the end of the input, inside a string, or
+        # partway through a literal; any other error is in the text itself
+        rest = payload[e.pos:]
+        return (
+            e.pos >= len(payload)
+            or e.msg.startswith("Unterminated string")
+            or any(literal.startswith(rest) for literal in _JSON_LITERALS)
+        )
+    return False
+
+
+def _is_empty_sprint(
+    metrics: Dict[str, Any],
+    blockers: List[Dict[str, Any]],
+    accomplishments: List[Dict[str, Any]],
+) -> bool:
+    """Return True for a sprint with no issues, where an LLM adds nothing to the fallback."""
+    return not blockers and not accomplishments and metrics.get("totalIssues", 0) == 0
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, adding an ellipsis when it was longer."""
+    return f"{text[:limit]}..." if len(text) > limit else text
+
+
+def _percent_value(value: Union[int, float, str]) -> float:
+    """Convert a percentage that may be formatted as "60.0%" to a float."""
+    if isinstance(value, str):
+        value = value.rstrip("%") or 0
+    return float(value)
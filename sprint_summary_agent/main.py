@@ -1,157 +1,253 @@
 """Sprint Summary Agent - Main entry point."""
 
+import asyncio
+import logging
 import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from .jira_client import JiraClient
-from .llm_recommendations import LLMRecommendationsGenerator
 from .output_generator import OutputGenerator
-from .powerpoint_generator import PowerPointGenerator
 from .settings import load_settings
 from .sprint_data_collector import SprintDataCollector
 
+if TYPE_CHECKING:
+    from .llm_summary_generator import LLMSummaryGenerator
 
-def main():
-    """Main execution function."""
-    print("🚀 Sprint Summary Agent Starting...\n")
+# Upper bound on sprints whose LLM calls are in flight at once
+MAX_CONCURRENT_SPRINTS = 8
 
-    try:
-        # Load and validate configuration
-        print("📋 Loading configuration...")
-        settings = load_settings()
-        project_keys = settings.get_project_keys()
-        team_labels = settings.get_team_labels()
-
-        print("✅ Configuration loaded successfully")
-        print(f"   Projects: {', '.join(project_keys)}")
-        team_display = ", ".join(team_labels) if team_labels else "None (latest sprint per project)"
-        print(f"   Teams: {team_display}\n")
-
-        # Initialize Jira client
-        print("🔗 Connecting to Jira...")
-        jira_client = JiraClient(settings.get_jira_config())
-        print(f"✅ Connected to {settings.jira_host}\n")
-
-        # Initialize components
-        data_collector = SprintDataCollector(jira_client)
-        output_generator = OutputGenerator()
-        llm_config = settings.get_llm_config()
-        llm_recommendations = LLMRecommendationsGenerator(
-            llm_config["provider"],
-            llm_config["api_key"],
-            llm_config["model"],
+
+async def process_sprint(
+    sprint_data: Dict[str, Any],
+    data_collector: SprintDataCollector,
+    llm_generator: "LLMSummaryGenerator",
+    output_generator: OutputGenerator,
+    output_dir: str,
+    semaphore: asyncio.Semaphore,
+    include_slide: bool = True,
+) -> Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Analyze one sprint, generate its recommendations and slide content, and save its reports.
+
+    Args:
+        include_slide: Generate slide content too; off when no presentation is built
+
+    Returns:
+        Tuple of (summary, metrics, slide content or None)
+    """
+    team_label = sprint_data.get("teamLabel") or "All Teams"
+    project_key = sprint_data["projectKey"]
+
+    # Progress is buffered so concurrent sprints don't interleave their output
+    lines = [f"\n📈 Processing: {project_key} - {team_label}", "─" * 60]
+
+    # Calculate metrics, analyze sprint health and extract key data; blocking work
+    # runs in worker threads so the other sprints' LLM calls keep making progress
+    analysis = await asyncio.to_thread(data_collector.summarize, sprint_data)
+    metrics = analysis["metrics"]
+    health_analysis = analysis["healthAnalysis"]
+    accomplishments = analysis["accomplishments"]
+    blockers = analysis["blockers"]
+    lines.append(f"   Health: {health_analysis['overallHealth']}")
+
+    # Generate recommendations and, when a deck is built, slide content with a single LLM call
+    async with semaphore:
+        llm_content = await llm_generator.generate_recommendations_and_slides_async(
+            metrics,
+            health_analysis,
+            sprint_data["sprint"],
+            sprint_data["project"],
+            {"label": sprint_data.get("teamLabel")},
+            blockers,
+            accomplishments,
+            include_slide=include_slide,
         )
+    if llm_content["generatedByLLM"]:
+        generated = "recommendations and slide content" if include_slide else "recommendations"
+        lines.append(f"   🤖 Generated AI {generated}")
 
-        # Collect sprint data for all projects and teams
-        data_description = "all projects and teams" if team_labels else "latest sprint per project"
-        print(f"📊 Collecting sprint data for {data_description}...")
-        all_sprint_data = data_collector.collect_all_sprint_data(project_keys, team_labels)
-        entity_type = "team(s)" if team_labels else "project(s)"
-        print(f"✅ Collected data for {len(all_sprint_data)} {entity_type}\n")
-
-        if not all_sprint_data:
-            print("⚠️  No sprint data found for any project/team combination")
-            return
-
-        # Process each team's sprint data
-        all_summaries = []
-        all_metrics = []
-        report_type = "team reports" if team_labels else "project reports"
-        print(f"🔄 Processing individual {report_type}...\n")
-
-        for sprint_data in all_sprint_data:
-            team_label = sprint_data.get("teamLabel") or "All Teams"
-            project_key = sprint_data["projectKey"]
-
-            print(f"\n📈 Processing: {project_key} - {team_label}")
-            print("─" * 60)
-
-            # Calculate metrics
-            metrics = data_collector.calculate_metrics(sprint_data)
-
-            # Analyze sprint health
-            health_analysis = data_collector.analyze_sprint_health(metrics)
-            print(f"   Health: {health_analysis['overallHealth']}")
-
-            # Extract key data
-            accomplishments = data_collector.extract_accomplishments(metrics, sprint_data["issues"])
-            blockers = data_collector.extract_blockers(metrics)
-
-            # Generate recommendations using LLM
-            print("   🤖 Generating AI recommendations...")
-            team_info = {"label": sprint_data.get("teamLabel")}
-            sprint_info = sprint_data["sprint"]
-            project_info = sprint_data["project"]
-
-            recommendations = llm_recommendations.generate_recommendations(
-                metrics,
-                health_analysis,
-                sprint_info,
-                project_info,
-                team_info,
-                blockers,
-                accomplishments,
-            )
+    # Generate summary
+    summary = output_generator.generate_summary(
+        sprint_data,
+        metrics,
+        health_analysis,
+        accomplishments,
+        blockers,
+        llm_content["recommendations"],
+    )
+
+    # Save team-specific outputs
+    await asyncio.to_thread(output_generator.save_json, summary, output_dir)
+    await asyncio.to_thread(output_generator.save_markdown, summary, output_dir)
+
+    lines.append(f"   ✅ Completed: {metrics['completedIssues']}/{metrics['totalIssues']} issues")
+    lines.append(f"   ✅ Velocity: {metrics['completedStoryPoints']}/{metrics['totalStoryPoints']} points")
+    print("\n".join(lines))
+
+    return summary, metrics, llm_content["slide"]
+
+
+def write_combined_summary(
+    output_generator: OutputGenerator,
+    all_summaries: List[Dict[str, Any]],
+    output_dir: str,
+) -> None:
+    """Generate the combined summary across all sprints and save it."""
+    combined_summary = output_generator.generate_combined_summary(all_summaries)
+    output_generator.save_combined_summary(combined_summary, output_dir)
+
+
+async def amain():
+    """Run the pipeline on one event loop.
+
+    Jira collection runs in a worker thread (JiraClient uses a pooled requests
+    session and fans out internally); the per-sprint LLM calls share the event
+    loop through the providers' async clients.
+    """
+    print("🚀 Sprint Summary Agent Starting...\n")
+
+    # Load and validate configuration
+    print("📋 Loading configuration...")
+    settings = load_settings()
+    project_keys = settings.get_project_keys()
+    team_labels = settings.get_team_labels()
+
+    team_display = ", ".join(team_labels) if team_labels else "None (latest sprint per project)"
+    print(
+        "✅ Configuration loaded successfully\n"
+        f"   Projects: {', '.join(project_keys)}\n"
+        f"   Teams: {team_display}\n"
+    )
 
-            # Generate summary
-            summary = output_generator.generate_summary(
+    # Initialize Jira client
+    print("🔗 Connecting to Jira...")
+    jira_client = JiraClient(settings.get_jira_config())
+    print(f"✅ Connected to {settings.jira_host}\n")
+
+    # Initialize components; the LLM SDKs are only imported once configuration is valid
+    from .llm_summary_generator import LLMSummaryGenerator
+
+    data_collector = SprintDataCollector(jira_client)
+    output_generator = OutputGenerator()
+    llm_config = settings.get_llm_config()
+    llm_generator = LLMSummaryGenerator(
+        llm_config["provider"],
+        llm_config["api_key"],
+        llm_config["model"],
+        llm_config["cache_dir"],
+    )
+
+    # Collect sprint data for all projects and teams
+    data_description = "all projects and teams" if team_labels else "latest sprint per project"
+    print(f"📊 Collecting sprint data for {data_description}...")
+    all_sprint_data = await asyncio.to_thread(data_collector.collect_all_sprint_data, project_keys, team_labels)
+    entity_type = "team(s)" if team_labels else "project(s)"
+    print(f"✅ Collected data for {len(all_sprint_data)} {entity_type}\n")
+
+    if not all_sprint_data:
+        print("⚠️  No sprint data found for any project/team combination")
+        return
+
+    # Process each team's sprint data
+    all_summaries = []
+    all_metrics = []
+    report_type = "team reports" if team_labels else "project reports"
+    print(f"🔄 Processing individual {report_type}...\n")
+
+    # Process sprints concurrently; gather keeps results in input order
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SPRINTS)
+    try:
+        results = await asyncio.gather(*[
+            process_sprint(
                 sprint_data,
-                metrics,
-                health_analysis,
-                accomplishments,
-                blockers,
-                recommendations,
+                data_collector,
+                llm_generator,
+                output_generator,
+                settings.output_dir,
+                semaphore,
+                settings.generate_powerpoint,
             )
+            for sprint_data in all_sprint_data
+        ])
+    finally:
+        # The async client is bound to this event loop, so it is closed before the loop ends
+        await llm_generator.aclose()
 
-            all_summaries.append(summary)
-            all_metrics.append(metrics)
-
-            # Save team-specific outputs
-            output_generator.save_json(summary, settings.output_dir)
-            output_generator.save_markdown(summary, settings.output_dir)
-
-            print(f"   ✅ Completed: {metrics['completedIssues']}/{metrics['totalIssues']} issues")
-            print(f"   ✅ Velocity: {metrics['completedStoryPoints']}/{metrics['totalStoryPoints']} points")
-
-        print("\n" + "═" * 60)
-        summary_title = "ALL TEAMS SUMMARY" if team_labels else "ALL PROJECTS SUMMARY"
-        print(f"📊 {summary_title}")
-        print("═" * 60)
-
-        # Print summary table
-        for summary in all_summaries:
-            team = summary["teamInfo"]["label"]
-            project = summary["projectInfo"]["key"]
-            health = summary["sprintHealthAnalysis"]["overallHealth"]
-            completion = summary["sprintHealthMetrics"]["completionRate"]
-            velocity = summary["sprintHealthMetrics"]["velocity"]
-
-            print(f"{project.ljust(15)} | {team.ljust(20)} | {health.ljust(8)} | Completion: {str(completion).ljust(6)} | Velocity: {velocity}")
-
-        # Generate combined summary if configured
-        if settings.generate_combined_summary and len(all_summaries) > 1:
-            combined_type = "all teams" if team_labels else "all projects"
-            print(f"\n📊 Generating combined summary across {combined_type}...")
-            combined_summary = output_generator.generate_combined_summary(all_summaries)
-            output_generator.save_combined_summary(combined_summary, settings.output_dir)
-            print("✅ Combined summary generated")
+    slide_contents = []
+    for summary, metrics, slide_content in results:
+        all_summaries.append(summary)
+        all_metrics.append(metrics)
+        slide_contents.append(slide_content)
+
+    summary_title = "ALL TEAMS SUMMARY" if team_labels else "ALL PROJECTS SUMMARY"
+    lines = ["\n" + "═" * 60, f"📊 {summary_title}", "═" * 60]
+
+    # Print summary table in one write
+    for summary in all_summaries:
+        team = summary["teamInfo"]["label"]
+        project = summary["projectInfo"]["key"]
+        health = summary["sprintHealthAnalysis"]["overallHealth"]
+        completion = summary["sprintHealthMetrics"]["completionRate"]
+        velocity = summary["sprintHealthMetrics"]["velocity"]
+
+        lines.append(f"{project.ljust(15)} | {team.ljust(20)} | {health.ljust(8)} | Completion: {str(completion).ljust(6)} | Velocity: {velocity}")
+    print("\n".join(lines))
 
-        # Generate PowerPoint presentation with LLM-powered content
-        print("\n📊 Generating PowerPoint presentation...")
-        ppt_generator = PowerPointGenerator(
-            llm_config["provider"],
-            llm_config["api_key"],
-            llm_config["model"],
+    # The combined summary and the presentation are independent, so the combined
+    # summary is written in a worker thread while the deck is built
+    combined_task = None
+    if settings.generate_combined_summary and len(all_summaries) > 1:
+        combined_type = "all teams" if team_labels else "all projects"
+        print(f"\n📊 Generating combined summary across {combined_type}...")
+        combined_task = asyncio.create_task(
+            asyncio.to_thread(write_combined_summary, output_generator, all_summaries, settings.output_dir)
         )
-        ppt_generator.generate_presentation(all_summaries, all_sprint_data, all_metrics, settings.output_dir)
-        print("✅ PowerPoint presentation generated")
 
-        print("\n" + "═" * 60)
-        print("✨ Sprint Summary Agent completed successfully!")
-        report_count = "team report(s)" if team_labels else "project report(s)"
-        print(f"   Generated {len(all_summaries)} {report_count}")
-        print(f"   Output directory: {settings.output_dir}")
-        print("═" * 60)
+    # Generate PowerPoint presentation with LLM-powered content; the combined
+    # summary is awaited even if the deck fails, so its thread isn't left running
+    try:
+        if settings.generate_powerpoint:
+            # Imported here so python-pptx is only loaded when a deck is requested
+            from .powerpoint_generator import PowerPointGenerator
+
+            print("\n📊 Generating PowerPoint presentation...")
+            ppt_generator = PowerPointGenerator(
+                llm_config["provider"],
+                llm_config["api_key"],
+                llm_config["model"],
+                llm_config["cache_dir"],
+            )
+            await asyncio.to_thread(
+                ppt_generator.generate_presentation,
+                all_summaries,
+                all_sprint_data,
+                all_metrics,
+                settings.output_dir,
+                slide_contents,
+            )
+            print("✅ PowerPoint presentation generated")
+    finally:
+        if combined_task is not None:
+            await combined_task
+            print("✅ Combined summary generated")
+
+    report_count = "team report(s)" if team_labels else "project report(s)"
+    print(
+        "\n" + "═" * 60 + "\n"
+        "✨ Sprint Summary Agent completed successfully!\n"
+        f"   Generated {len(all_summaries)} {report_count}\n"
+        f"   Output directory: {settings.output_dir}\n"
+        + "═" * 60
+    )
 
+
+def main():
+    """Main execution function."""
+    # Show the package's progress messages as plain lines, without third-party INFO logs
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("sprint_summary_agent").setLevel(logging.INFO)
+
+    try:
+        asyncio.run(amain())
     except Exception as error:
         print(f"\n❌ Error: {error}")
         import traceback
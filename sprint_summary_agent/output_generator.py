@@ -1,14 +1,65 @@
 """Output Generator - Generates JSON and Markdown formatted sprint summaries."""
 
-import json
-from datetime import datetime
+import hashlib
+import heapq
+import os
+import re
+from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from . import json_utils
+from .datetime_utils import parse_timestamp
+
+# Formats for dates shown in Markdown reports
+DATE_FORMAT = "%Y-%m-%d"
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Summary fields that change on every run, left out of content fingerprints
+GENERATED_AT_KEYS = frozenset({"generatedAt", "generatedAtFormatted"})
+
+# Version of the combined JSON/Markdown layout, part of the report fingerprint;
+# bump it whenever the rendering changes so existing reports are rewritten
+COMBINED_FORMAT_VERSION = 1
+
+# Priorities added to every next sprint plan, after the data-driven ones
+_STANDING_PRIORITIES = (
+    {"priority": "Medium", "item": "Conduct sprint planning with updated velocity metrics"},
+    {"priority": "Low", "item": "Schedule retrospective to discuss improvements"},
+)
+
+# Characters replaced with "_" in generated filenames (anything not alphanumeric)
+_UNSAFE_FILENAME_RE = re.compile(r"\W")
 
 
 class OutputGenerator:
     """Generates JSON and Markdown formatted sprint summaries."""
 
+    # Per-team sprint health metrics summed into the combined summary
+    _AGG_KEYS = (
+        "totalIssues",
+        "completedIssues",
+        "inProgressIssues",
+        "todoIssues",
+        "blockedIssues",
+        "totalStoryPoints",
+        "completedStoryPoints",
+    )
+
+    def __init__(self):
+        """Initialize generator."""
+        # Output directories already created during this run
+        self._created_dirs: Set[str] = set()
+
+    def _ensure_output_dir(self, output_dir: str) -> Path:
+        """Create output_dir on first use and return it as a Path."""
+        output_path = Path(output_dir)
+        if output_dir not in self._created_dirs:
+            output_path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(output_dir)
+        return output_path
+
     def generate_summary(
         self,
         sprint_data: Dict[str, Any],
@@ -23,6 +74,7 @@ class OutputGenerator:
         team_members = sprint_data["teamMembers"]
         project = sprint_data["project"]
         team_label = sprint_data.get("teamLabel")
+        generated_at = datetime.now(timezone.utc)
 
         return {
             "sprintInfo": {
@@ -31,6 +83,8 @@ class OutputGenerator:
                 "state": sprint.get("state", "unknown"),
                 "startDate": sprint["startDate"],
                 "endDate": sprint["endDate"],
+                "startDateFormatted": format_timestamp(sprint["startDate"], DATE_FORMAT),
+                "endDateFormatted": format_timestamp(sprint["endDate"], DATE_FORMAT),
                 "goal": sprint.get("goal", "No goal set"),
             },
             "projectInfo": {
@@ -83,7 +137,8 @@ class OutputGenerator:
                 "velocitySummary": f"{metrics['completedStoryPoints']} of {metrics['totalStoryPoints']} story points completed ({metrics['velocityPercentage']}%)",
             },
             "recommendations": recommendations,
-            "generatedAt": datetime.utcnow().isoformat() + "Z",
+            "generatedAt": generated_at.isoformat().replace("+00:00", "Z"),
+            "generatedAtFormatted": generated_at.strftime(TIMESTAMP_FORMAT),
         }
 
     def generate_next_sprint_priorities(
@@ -113,16 +168,8 @@ class OutputGenerator:
                 "item": f"Review and re-prioritize {metrics['todoIssues']} unstarted issue(s)",
             })
 
-        # General planning
-        priorities.append({
-            "priority": "Medium",
-            "item": "Conduct sprint planning with updated velocity metrics",
-        })
-
-        priorities.append({
-            "priority": "Low",
-            "item": "Schedule retrospective to discuss improvements",
-        })
+        # General planning (copied so callers never share the module-level dicts)
+        priorities.extend(dict(priority) for priority in _STANDING_PRIORITIES)
 
         return priorities
 
@@ -130,21 +177,24 @@ class OutputGenerator:
         """Generate filename based on project and team."""
         project_key = summary["projectInfo"]["key"]
         team_label = summary["teamInfo"]["label"]
-        sanitized_team = "".join(c if c.isalnum() else "_" for c in team_label)
+        sanitized_team = _UNSAFE_FILENAME_RE.sub("_", team_label)
         return f"sprint-summary-{project_key}-{sanitized_team}.{extension}"
 
     def save_json(
-        self, summary: Dict[str, Any], output_dir: str = "./output", filename: Optional[str] = None
+        self,
+        summary: Dict[str, Any],
+        output_dir: str = "./output",
+        filename: Optional[str] = None,
+        pretty: bool = False,
     ) -> str:
-        """Save JSON output."""
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        """Save JSON output (compact unless pretty is set)."""
+        output_path = self._ensure_output_dir(output_dir)
 
         file_name = filename or self.generate_filename(summary, "json")
         file_path = output_path / file_name
 
-        with open(file_path, "w") as f:
-            json.dump(summary, f, indent=2)
+        with open(file_path, "wb") as f:
+            f.write(json_utils.dumps(summary, pretty=pretty))
 
         print(f"JSON summary saved to: {file_path}")
         return str(file_path)
@@ -153,15 +203,14 @@ class OutputGenerator:
         self, summary: Dict[str, Any], output_dir: str = "./output", filename: Optional[str] = None
     ) -> str:
         """Generate and save Markdown output."""
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        output_path = self._ensure_output_dir(output_dir)
 
-        markdown = self.generate_markdown(summary)
         file_name = filename or self.generate_filename(summary, "md")
         file_path = output_path / file_name
 
+        # Stream the Markdown chunks straight to the file
         with open(file_path, "w") as f:
-            f.write(markdown)
+            f.writelines(self._iter_markdown(summary))
 
         print(f"Markdown summary saved to: {file_path}")
         return str(file_path)
@@ -172,16 +221,8 @@ class OutputGenerator:
             return None
 
         # Aggregate metrics across all teams
-        combined_metrics = {
-            "totalIssues": 0,
-            "completedIssues": 0,
-            "inProgressIssues": 0,
-            "todoIssues": 0,
-            "blockedIssues": 0,
-            "totalStoryPoints": 0,
-            "completedStoryPoints": 0,
-            "totalTeamMembers": 0,
-        }
+        combined_metrics = dict.fromkeys(self._AGG_KEYS, 0)
+        combined_metrics["totalTeamMembers"] = 0
 
         all_blockers = []
         all_accomplishments = []
@@ -191,34 +232,25 @@ class OutputGenerator:
         for summary in all_summaries:
             # Aggregate metrics
             metrics = summary["sprintHealthMetrics"]
-            combined_metrics["totalIssues"] += metrics["totalIssues"]
-            combined_metrics["completedIssues"] += metrics["completedIssues"]
-            combined_metrics["inProgressIssues"] += metrics["inProgressIssues"]
-            combined_metrics["todoIssues"] += metrics["todoIssues"]
-            combined_metrics["blockedIssues"] += metrics["blockedIssues"]
-            combined_metrics["totalStoryPoints"] += metrics["totalStoryPoints"]
-            combined_metrics["completedStoryPoints"] += metrics["completedStoryPoints"]
+            for key in self._AGG_KEYS:
+                combined_metrics[key] += metrics[key]
             combined_metrics["totalTeamMembers"] += summary["teamComposition"]["totalMembers"]
 
+            team_label = summary["teamInfo"]["label"]
+            project_info = summary["projectInfo"]
+            project_key = project_info["key"]
+
             # Collect blockers
             for blocker in summary["currentBlockers"]:
-                all_blockers.append({
-                    **blocker,
-                    "team": summary["teamInfo"]["label"],
-                    "project": summary["projectInfo"]["key"],
-                })
+                all_blockers.append(dict(blocker, team=team_label, project=project_key))
 
             # Collect accomplishments
             for accomplishment in summary["keyAccomplishments"]:
-                all_accomplishments.append({
-                    **accomplishment,
-                    "team": summary["teamInfo"]["label"],
-                    "project": summary["projectInfo"]["key"],
-                })
+                all_accomplishments.append(dict(accomplishment, team=team_label, project=project_key))
 
             # Track projects and teams
-            projects_map[summary["projectInfo"]["key"]] = summary["projectInfo"]["name"]
-            teams_set.add(summary["teamInfo"]["label"])
+            projects_map[project_key] = project_info["name"]
+            teams_set.add(team_label)
 
         # Calculate combined percentages
         completion_rate = (
@@ -232,8 +264,11 @@ class OutputGenerator:
             else 0
         )
 
-        # Sort accomplishments by story points
-        all_accomplishments.sort(key=lambda x: x.get("storyPoints", 0), reverse=True)
+        # Keep the highest story point accomplishments
+        top_accomplishments = heapq.nlargest(
+            20, all_accomplishments, key=lambda x: x.get("storyPoints", 0)
+        )
+        generated_at = datetime.now(timezone.utc)
 
         return {
             "title": "Combined Sprint Summary - All Teams",
@@ -246,7 +281,7 @@ class OutputGenerator:
                 "velocity": combined_metrics["completedStoryPoints"],
             },
             "currentBlockers": all_blockers[:20],  # Top 20 blockers
-            "keyAccomplishments": all_accomplishments[:20],  # Top 20 accomplishments
+            "keyAccomplishments": top_accomplishments,  # Top 20 accomplishments
             "teamSummaries": [
                 {
                     "team": s["teamInfo"]["label"],
@@ -257,36 +292,62 @@ class OutputGenerator:
                 }
                 for s in all_summaries
             ],
-            "generatedAt": datetime.utcnow().isoformat() + "Z",
+            "generatedAt": generated_at.isoformat().replace("+00:00", "Z"),
+            "generatedAtFormatted": generated_at.strftime(TIMESTAMP_FORMAT),
         }
 
     def save_combined_summary(
-        self, combined_summary: Optional[Dict[str, Any]], output_dir: str = "./output"
+        self,
+        combined_summary: Optional[Dict[str, Any]],
+        output_dir: str = "./output",
+        pretty: bool = False,
     ) -> Optional[Dict[str, str]]:
-        """Save combined summary."""
+        """Save combined summary (JSON is compact unless pretty is set).
+
+        Reports whose content is unchanged since the last save (ignoring the
+        generation time) are not rewritten; their modification time is updated.
+        """
         if not combined_summary:
             return None
 
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        output_path = self._ensure_output_dir(output_dir)
+        json_path = output_path / "sprint-summary-combined.json"
+        md_path = output_path / "sprint-summary-combined.md"
+        sha_path = output_path / "sprint-summary-combined.sha"
+        paths = {"jsonPath": str(json_path), "mdPath": str(md_path)}
+
+        # Skipping the rewrite trades freshness for fewer writes: the kept reports
+        # still show the "Generated" time of the run that wrote them, and only their
+        # modification time moves forward. Layout changes rewrite them through
+        # COMBINED_FORMAT_VERSION, which is part of the fingerprint.
+        fingerprint = _summary_fingerprint(combined_summary, pretty)
+        if json_path.exists() and md_path.exists() and _read_fingerprint(sha_path) == fingerprint:
+            os.utime(json_path)
+            os.utime(md_path)
+            print(f"Combined summary unchanged, keeping: {json_path}, {md_path}")
+            return paths
 
         # Save JSON
-        json_path = output_path / "sprint-summary-combined.json"
-        with open(json_path, "w") as f:
-            json.dump(combined_summary, f, indent=2)
+        with open(json_path, "wb") as f:
+            f.write(json_utils.dumps(combined_summary, pretty=pretty))
         print(f"Combined JSON summary saved to: {json_path}")
 
         # Generate and save Markdown
-        markdown = self.generate_combined_markdown(combined_summary)
-        md_path = output_path / "sprint-summary-combined.md"
         with open(md_path, "w") as f:
-            f.write(markdown)
+            f.writelines(self._iter_combined_markdown(combined_summary))
         print(f"Combined Markdown summary saved to: {md_path}")
 
-        return {"jsonPath": str(json_path), "mdPath": str(md_path)}
+        # Written last so an interrupted save is never mistaken for an unchanged one
+        sha_path.write_text(fingerprint)
+
+        return paths
 
     def generate_markdown(self, summary: Dict[str, Any]) -> str:
         """Generate Markdown formatted summary."""
+        return "".join(self._iter_markdown(summary))
+
+    def _iter_markdown(self, summary: Dict[str, Any]) -> Iterator[str]:
+        """Yield the Markdown summary in chunks, in document order."""
         sprint_info = summary["sprintInfo"]
         project_info = summary["projectInfo"]
         team_info = summary["teamInfo"]
@@ -300,17 +361,22 @@ class OutputGenerator:
         status = summary["sprintStatus"]
         recommendations = summary["recommendations"]
 
-        start_date = datetime.fromisoformat(sprint_info["startDate"].replace("Z", "+00:00"))
-        end_date = datetime.fromisoformat(sprint_info["endDate"].replace("Z", "+00:00"))
-        generated = datetime.fromisoformat(summary["generatedAt"].replace("Z", "+00:00"))
+        # Summaries saved before the formatted fields existed are formatted here
+        start_date = sprint_info.get("startDateFormatted") or format_timestamp(sprint_info["startDate"], DATE_FORMAT)
+        end_date = sprint_info.get("endDateFormatted") or format_timestamp(sprint_info["endDate"], DATE_FORMAT)
+        generated = summary.get("generatedAtFormatted") or format_timestamp(summary["generatedAt"], TIMESTAMP_FORMAT)
+
+        # Row fields unpacked once per blocker/accomplishment
+        get_blocker = itemgetter("key", "summary", "type", "priority", "assignee", "status")
+        get_accomplishment = itemgetter("key", "summary", "type", "priority", "assignee", "storyPoints")
 
-        markdown = f"""# Sprint Summary: {sprint_info['name']}
+        yield f"""# Sprint Summary: {sprint_info['name']}
 
 **Project:** {project_info['name']} ({project_info['key']})
 **Team:** {team_info['label']}
-**Sprint Duration:** {start_date.strftime('%Y-%m-%d')} - {end_date.strftime('%Y-%m-%d')} ({metrics['sprintDurationDays']} days)
+**Sprint Duration:** {start_date} - {end_date} ({metrics['sprintDurationDays']} days)
 **Sprint Goal:** {sprint_info['goal']}
-**Generated:** {generated.strftime('%Y-%m-%d %H:%M:%S')}
+**Generated:** {generated}
 
 ---
 
@@ -338,9 +404,9 @@ class OutputGenerator:
 
 """
         for indicator in health["healthIndicators"]:
-            markdown += f"- **{indicator['indicator']}:** {indicator['status']} - {indicator['message']}\n"
+            yield f"- **{indicator['indicator']}:** {indicator['status']} - {indicator['message']}\n"
 
-        markdown += """
+        yield """
 ---
 
 ## 💼 What the Team Worked On
@@ -348,13 +414,13 @@ class OutputGenerator:
 ### Issues by Type
 """
         for issue_type, count in worked_on["issuesByType"].items():
-            markdown += f"- {issue_type}: {count}\n"
+            yield f"- {issue_type}: {count}\n"
 
-        markdown += "\n### Issues by Priority\n"
+        yield "\n### Issues by Priority\n"
         for priority, count in worked_on["issuesByPriority"].items():
-            markdown += f"- {priority}: {count}\n"
+            yield f"- {priority}: {count}\n"
 
-        markdown += f"""
+        yield f"""
 ### Work Distribution
 - ✅ Completed: {worked_on['completedWork']} issues
 - 🔄 In Progress: {worked_on['inProgressWork']} issues
@@ -365,40 +431,42 @@ class OutputGenerator:
 
 """
         if blockers:
-            for blocker in blockers:
-                markdown += f"""### {blocker['key']}: {blocker['summary']}
-- **Type:** {blocker['type']}
-- **Priority:** {blocker['priority']}
-- **Assignee:** {blocker['assignee']}
-- **Status:** {blocker['status']}
+            for key, title, issue_type, priority, assignee, status_name in map(get_blocker, blockers):
+                yield f"""### {key}: {title}
+- **Type:** {issue_type}
+- **Priority:** {priority}
+- **Assignee:** {assignee}
+- **Status:** {status_name}
 
 """
         else:
-            markdown += "*No blockers identified*\n"
+            yield "*No blockers identified*\n"
 
-        markdown += """---
+        yield """---
 
 ## 🎯 Key Accomplishments
 
 """
-        for i, accomplishment in enumerate(accomplishments[:10], 1):
-            markdown += f"""{i}. **{accomplishment['key']}:** {accomplishment['summary']}
-   - Type: {accomplishment['type']}
-   - Priority: {accomplishment['priority']}
-   - Assignee: {accomplishment['assignee']}
-   - Story Points: {accomplishment['storyPoints']}
+        for i, (key, title, issue_type, priority, assignee, points) in enumerate(
+            map(get_accomplishment, accomplishments[:10]), 1
+        ):
+            yield f"""{i}. **{key}:** {title}
+   - Type: {issue_type}
+   - Priority: {priority}
+   - Assignee: {assignee}
+   - Story Points: {points}
 
 """
 
-        markdown += """---
+        yield """---
 
 ## 📋 Next Sprint Priorities
 
 """
         for i, priority in enumerate(priorities, 1):
-            markdown += f"{i}. **[{priority['priority']}]** {priority['item']}\n"
+            yield f"{i}. **[{priority['priority']}]** {priority['item']}\n"
 
-        markdown += f"""
+        yield f"""
 ---
 
 ## 👥 Team Composition
@@ -407,9 +475,9 @@ class OutputGenerator:
 
 """
         for member in team_comp["members"]:
-            markdown += f"- {member['displayName']} ({member['email']})\n"
+            yield f"- {member['displayName']} ({member['email']})\n"
 
-        markdown += f"""
+        yield f"""
 ---
 
 ## 📈 Sprint Status
@@ -425,24 +493,34 @@ class OutputGenerator:
 
 """
         for i, rec in enumerate(recommendations, 1):
-            markdown += f"""{i}. **[{rec['priority']}] {rec['category']}**
+            yield f"""{i}. **[{rec['priority']}] {rec['category']}**
    {rec['recommendation']}
 
 """
 
-        markdown += """---
+        yield """---
 
 *Report generated by Sprint Summary Agent*
 """
-        return markdown
 
     def generate_combined_markdown(self, combined: Dict[str, Any]) -> str:
         """Generate combined Markdown."""
-        generated = datetime.fromisoformat(combined["generatedAt"].replace("Z", "+00:00"))
+        return "".join(self._iter_combined_markdown(combined))
 
-        markdown = f"""# {combined['title']}
+    def _iter_combined_markdown(self, combined: Dict[str, Any]) -> Iterator[str]:
+        """Yield the combined Markdown summary in chunks, in document order."""
+        generated = combined.get("generatedAtFormatted") or format_timestamp(combined["generatedAt"], TIMESTAMP_FORMAT)
 
-**Generated:** {generated.strftime('%Y-%m-%d %H:%M:%S')}
+        # Row fields unpacked once per team/blocker/accomplishment
+        get_team = itemgetter("team", "project", "health", "completionRate", "velocity")
+        get_blocker = itemgetter("key", "summary", "team", "project", "type", "priority", "assignee", "status")
+        get_accomplishment = itemgetter(
+            "key", "summary", "team", "project", "type", "priority", "assignee", "storyPoints"
+        )
+
+        yield f"""# {combined['title']}
+
+**Generated:** {generated}
 
 ---
 
@@ -467,45 +545,70 @@ class OutputGenerator:
 ## 👥 Team Summary
 
 """
-        for team in combined["teamSummaries"]:
-            markdown += f"- **{team['team']}** ({team['project']}): {team['health']} - Completion: {team['completionRate']}, Velocity: {team['velocity']}\n"
+        for team, project, health, completion_rate, velocity in map(get_team, combined["teamSummaries"]):
+            yield f"- **{team}** ({project}): {health} - Completion: {completion_rate}, Velocity: {velocity}\n"
 
-        markdown += """
+        yield """
 ---
 
 ## 🚧 All Blockers (Top 20)
 
 """
         if combined["currentBlockers"]:
-            for blocker in combined["currentBlockers"]:
-                markdown += f"""### {blocker['key']}: {blocker['summary']}
-- **Team:** {blocker['team']} ({blocker['project']})
-- **Type:** {blocker['type']}
-- **Priority:** {blocker['priority']}
-- **Assignee:** {blocker['assignee']}
-- **Status:** {blocker['status']}
+            for key, title, team, project, issue_type, priority, assignee, status_name in map(
+                get_blocker, combined["currentBlockers"]
+            ):
+                yield f"""### {key}: {title}
+- **Team:** {team} ({project})
+- **Type:** {issue_type}
+- **Priority:** {priority}
+- **Assignee:** {assignee}
+- **Status:** {status_name}
 
 """
         else:
-            markdown += "*No blockers identified*\n"
+            yield "*No blockers identified*\n"
 
-        markdown += """---
+        yield """---
 
 ## 🎯 Top Accomplishments (Top 20)
 
 """
-        for i, accomplishment in enumerate(combined["keyAccomplishments"], 1):
-            markdown += f"""{i}. **{accomplishment['key']}:** {accomplishment['summary']}
-   - Team: {accomplishment['team']} ({accomplishment['project']})
-   - Type: {accomplishment['type']}
-   - Priority: {accomplishment['priority']}
-   - Assignee: {accomplishment['assignee']}
-   - Story Points: {accomplishment['storyPoints']}
+        for i, (key, title, team, project, issue_type, priority, assignee, points) in enumerate(
+            map(get_accomplishment, combined["keyAccomplishments"]), 1
+        ):
+            yield f"""{i}. **{key}:** {title}
+   - Team: {team} ({project})
+   - Type: {issue_type}
+   - Priority: {priority}
+   - Assignee: {assignee}
+   - Story Points: {points}
 
 """
 
-        markdown += """---
+        yield """---
 
 *Combined report generated by Sprint Summary Agent*
 """
-        return markdown
+
+
+def format_timestamp(value: str, fmt: str) -> str:
+    """Format an ISO 8601 timestamp (optionally "Z"-suffixed) with strftime."""
+    return parse_timestamp(value).strftime(fmt)
+
+
+def _summary_fingerprint(summary: Dict[str, Any], pretty: bool) -> str:
+    """Hash a summary's content and output format, ignoring when it was generated."""
+    content = {k: v for k, v in summary.items() if k not in GENERATED_AT_KEYS}
+    digest = hashlib.blake2b(json_utils.dumps(content, sort_keys=True), digest_size=16)
+    digest.update(b"pretty" if pretty else b"compact")
+    digest.update(f"v{COMBINED_FORMAT_VERSION}".encode())
+    return digest.hexdigest()
+
+
+def _read_fingerprint(path: Path) -> Optional[str]:
+    """Read a previously saved fingerprint, or None if there is none."""
+    try:
+        return path.read_text()
+    except OSError:
+        return None
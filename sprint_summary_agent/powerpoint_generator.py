@@ -1,15 +1,23 @@
 """PowerPoint Generator - Simple version for maximum compatibility."""
 
+import hashlib
+import io
+import threading
+from concurrent.futures import Future
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.util import Inches, Pt
 
+from . import json_utils
+from .file_utils import atomic_write_bytes
 from .llm_summary_generator import LLMSummaryGenerator
+from .output_generator import GENERATED_AT_KEYS
+from .slide_content import fill_slide_contents
 
 
 class PowerPointGenerator:
@@ -30,12 +38,63 @@ class PowerPointGenerator:
         "blue": RGBColor(33, 150, 243),     # Blue accent
     }
 
-    def __init__(self, provider: str, api_key: str, model: str):
-        """Initialize with LLM provider configuration."""
+    # Health status (lowercase) to color
+    _HEALTH_COLOR_MAP = {
+        "good": COLORS["good"],
+        "fair": COLORS["fair"],
+        "poor": COLORS["poor"],
+    }
+
+    # 2x2 layout positions - use simple textboxes only
+    _BOX_POSITIONS = (
+        (Inches(0.5), Inches(1.2)),  # Top left
+        (Inches(5.2), Inches(1.2)),  # Top right
+        (Inches(0.5), Inches(4.2)),  # Bottom left
+        (Inches(5.2), Inches(4.2)),  # Bottom right
+    )
+
+    # Slide content section shown in each box, in _BOX_POSITIONS order
+    _BOX_SECTIONS = ("healthSummary", "accomplishments", "blockers", "recommendations")
+
+    # Fixed team slide geometry, converted to EMU once
+    _TEAM_TITLE_BOX = (Inches(0.5), Inches(0.2), Inches(9), Inches(0.6))
+    _TEAM_TITLE_SIZE = Pt(28)
+    _BOX_WIDTH = Inches(4.3)
+    _BOX_HEIGHT = Inches(2.8)
+    _BOX_MARGIN = Pt(10)
+    _BOX_TITLE_SIZE = Pt(16)
+    _BOX_TITLE_SPACE = Pt(8)
+    _BULLET_SIZE = Pt(11)
+    _BULLET_SPACE = Pt(4)
+
+    def __init__(
+        self,
+        provider: str,
+        api_key: str,
+        model: str,
+        cache_dir: Optional[str] = None,
+        batch_mode: bool = False,
+    ):
+        """Initialize with LLM provider configuration.
+
+        Args:
+            provider: LLM provider name
+            api_key: API key for the provider
+            model: Model name to use
+            cache_dir: Optional directory for caching LLM responses
+            batch_mode: Generate missing slide content through the provider's
+                batch API (cheaper, but can take hours) for non-interactive runs.
+                Library use only: the CLI passes in slide content generated
+                alongside the recommendations, so it never takes this path.
+        """
+        self.batch_mode = batch_mode
         self.prs = Presentation()
         self.prs.slide_width = Inches(10)
         self.prs.slide_height = Inches(7.5)
-        self.llm_generator = LLMSummaryGenerator(provider, api_key, model)
+        self.llm_generator = LLMSummaryGenerator(provider, api_key, model, cache_dir)
+        # Slide content generated (or being generated) by this instance, keyed by summary hash
+        self._llm_cache: Dict[str, Future] = {}
+        self._llm_cache_lock = threading.Lock()
 
     def generate_presentation(
         self,
@@ -43,22 +102,44 @@ class PowerPointGenerator:
         all_sprint_data: List[Dict[str, Any]],
         all_metrics: List[Dict[str, Any]],
         output_dir: str = "./output",
+        slide_contents: Optional[List[Dict[str, Any]]] = None,
     ):
-        """Generate PowerPoint presentation with LLM-powered content."""
+        """Generate PowerPoint presentation with LLM-powered content.
+
+        Args:
+            all_summaries: Sprint summaries, one per team
+            all_sprint_data: Raw sprint data, one per team
+            all_metrics: Calculated metrics, one per team
+            output_dir: Directory to write the presentation to
+            slide_contents: Optional pre-generated slide content per team; missing
+                content is generated here with one concurrent LLM call per team
+        """
+        # Generate missing slide content up front; python-pptx is not thread-safe,
+        # so the slides themselves are still built serially below
+        slide_contents = fill_slide_contents(
+            all_summaries,
+            slide_contents,
+            self._get_slide_content,
+            self.llm_generator.generate_slide_contents_batch if self.batch_mode else None,
+        )
+
         # Add title slide
         self._create_title_slide(all_summaries)
 
         # Add slide for each team
-        for i, (summary, sprint_data, metrics) in enumerate(zip(all_summaries, all_sprint_data, all_metrics)):
-            print(f"   🤖 Generating AI slide content for {summary['teamInfo']['label']}...")
-            self._create_team_slide(summary, sprint_data, metrics)
+        for summary, sprint_data, metrics, llm_content in zip(all_summaries, all_sprint_data, all_metrics, slide_contents):
+            self._create_team_slide(summary, sprint_data, metrics, llm_content)
 
         # Save presentation
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         file_path = output_path / "sprint-summary-presentation.pptx"
 
-        self.prs.save(str(file_path))
+        # Serialize in memory, then write the file in one go instead of many small zip
+        # writes; the temp file is renamed into place so readers never see a partial deck
+        buffer = io.BytesIO()
+        self.prs.save(buffer)
+        atomic_write_bytes(file_path, buffer.getbuffer())
         print(f"   ✅ PowerPoint saved to: {file_path}")
 
     def _create_title_slide(self, all_summaries: List[Dict[str, Any]]):
@@ -87,6 +168,7 @@ class PowerPointGenerator:
         summary: Dict[str, Any],
         sprint_data: Dict[str, Any],
         metrics: Dict[str, Any],
+        llm_content: Optional[Dict[str, Any]] = None,
     ):
         """Create a slide for a specific team with 2x2 layout - simplified."""
         blank_layout = self.prs.slide_layouts[6]
@@ -97,81 +179,42 @@ class PowerPointGenerator:
         health = summary["sprintHealthMetrics"]["overallHealth"]
 
         # Title at top
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(9), Inches(0.6))
+        title_box = slide.shapes.add_textbox(*self._TEAM_TITLE_BOX)
         title_frame = title_box.text_frame
         title_frame.text = f"Team: {team_label} ({project_key}) - Health: {health}"
         title_para = title_frame.paragraphs[0]
-        title_para.font.size = Pt(28)
+        title_para.font.size = self._TEAM_TITLE_SIZE
         title_para.font.bold = True
         title_para.font.color.rgb = self._get_health_color(health)
 
         # Get LLM-generated content
-        llm_content = self.llm_generator.generate_slide_content(summary)
-
-        # 2x2 layout positions - use simple textboxes only
-        positions = [
-            (Inches(0.5), Inches(1.2)),  # Top left
-            (Inches(5.2), Inches(1.2)),  # Top right
-            (Inches(0.5), Inches(4.2)),  # Bottom left
-            (Inches(5.2), Inches(4.2)),  # Bottom right
-        ]
-
-        box_width = Inches(4.3)
-        box_height = Inches(2.8)
-
-        # Top Left: Health Summary
-        self._add_simple_box(
-            slide,
-            positions[0][0],
-            positions[0][1],
-            box_width,
-            box_height,
-            llm_content["healthSummary"]["title"],
-            llm_content["healthSummary"]["bullets"],
-            self._get_health_color(health),
-        )
-
-        # Top Right: Accomplishments
-        self._add_simple_box(
-            slide,
-            positions[1][0],
-            positions[1][1],
-            box_width,
-            box_height,
-            llm_content["accomplishments"]["title"],
-            llm_content["accomplishments"]["bullets"],
-            self.COLORS["success_green"],
-        )
+        if llm_content is None:
+            llm_content = self._get_slide_content(summary)
 
-        # Bottom Left: Blockers
+        # Title colors for the 2x2 boxes, in _BOX_SECTIONS order
         blocker_color = (
-            self.COLORS["blocker_red"]
-            if summary.get("currentBlockers") and len(summary["currentBlockers"]) > 0
-            else self.COLORS["success_green"]
+            self.COLORS["blocker_red"] if summary.get("currentBlockers") else self.COLORS["success_green"]
         )
-        self._add_simple_box(
-            slide,
-            positions[2][0],
-            positions[2][1],
-            box_width,
-            box_height,
-            llm_content["blockers"]["title"],
-            llm_content["blockers"]["bullets"],
+        box_colors = (
+            self._get_health_color(health),
+            self.COLORS["success_green"],
             blocker_color,
-        )
-
-        # Bottom Right: Recommendations
-        self._add_simple_box(
-            slide,
-            positions[3][0],
-            positions[3][1],
-            box_width,
-            box_height,
-            llm_content["recommendations"]["title"],
-            llm_content["recommendations"]["bullets"],
             self.COLORS["blue"],
         )
 
+        for (left, top), section, color in zip(self._BOX_POSITIONS, self._BOX_SECTIONS, box_colors):
+            content = llm_content[section]
+            self._add_simple_box(
+                slide,
+                left,
+                top,
+                self._BOX_WIDTH,
+                self._BOX_HEIGHT,
+                content["title"],
+                content["bullets"],
+                color,
+            )
+
     def _add_simple_box(
         self,
         slide,
@@ -188,34 +231,52 @@ class PowerPointGenerator:
         textbox = slide.shapes.add_textbox(left, top, width, height)
         text_frame = textbox.text_frame
         text_frame.word_wrap = True
-        text_frame.margin_top = Pt(10)
-        text_frame.margin_left = Pt(10)
-        text_frame.margin_right = Pt(10)
+        text_frame.margin_top = self._BOX_MARGIN
+        text_frame.margin_left = self._BOX_MARGIN
+        text_frame.margin_right = self._BOX_MARGIN
 
         # Add title
         p = text_frame.paragraphs[0]
         p.text = title
-        p.font.size = Pt(16)
+        p.font.size = self._BOX_TITLE_SIZE
         p.font.bold = True
         p.font.color.rgb = title_color
-        p.space_after = Pt(8)
+        p.space_after = self._BOX_TITLE_SPACE
 
         # Add bullets
         for bullet in bullets:
             p = text_frame.add_paragraph()
             p.text = f"• {bullet}"
-            p.font.size = Pt(11)
+            p.font.size = self._BULLET_SIZE
             p.font.color.rgb = self.COLORS["text"]
-            p.space_before = Pt(4)
+            p.space_before = self._BULLET_SPACE
+
+    def _get_slide_content(self, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Get LLM slide content, reusing it for summaries already seen by this instance.
+
+        Summaries with the same content, whatever their generation timestamps,
+        share a single in-flight LLM call when requested concurrently.
+        """
+        # Generation timestamps don't affect the slide, so they are left out of the key
+        content = {k: v for k, v in summary.items() if k not in GENERATED_AT_KEYS}
+        key = hashlib.blake2b(json_utils.dumps(content, sort_keys=True), digest_size=16).hexdigest()
+        with self._llm_cache_lock:
+            future = self._llm_cache.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._llm_cache[key] = future
+
+        if is_owner:
+            try:
+                future.set_result(self.llm_generator.generate_slide_content(summary))
+            except Exception as e:
+                # Let a later request retry instead of caching the failure
+                with self._llm_cache_lock:
+                    del self._llm_cache[key]
+                future.set_exception(e)
+        return future.result()
 
     def _get_health_color(self, health: str) -> RGBColor:
         """Get color for health status."""
-        health_lower = health.lower()
-        if health_lower == "good":
-            return self.COLORS["good"]
-        elif health_lower == "fair":
-            return self.COLORS["fair"]
-        elif health_lower == "poor":
-            return self.COLORS["poor"]
-        else:
-            return self.COLORS["gray"]
+        return self._HEALTH_COLOR_MAP.get(health.lower(), self.COLORS["gray"])
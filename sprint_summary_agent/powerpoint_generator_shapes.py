@@ -1,8 +1,9 @@
 """PowerPoint Generator - Creates presentation slides with sprint summaries."""
 
+import io
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from pptx import Presentation
 from pptx.dml.color import RGBColor
@@ -10,7 +11,9 @@ from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.util import Inches, Pt
 
+from .file_utils import atomic_write_bytes
 from .llm_summary_generator import LLMSummaryGenerator
+from .slide_content import fill_slide_contents
 
 
 class PowerPointGenerator:
@@ -31,12 +34,51 @@ class PowerPointGenerator:
         "blue": RGBColor(33, 150, 243),     # Blue accent
     }
 
-    def __init__(self, provider: str, api_key: str, model: str):
+    # Health status (lowercase) to color
+    _HEALTH_COLOR_MAP = {
+        "good": COLORS["good"],
+        "fair": COLORS["fair"],
+        "poor": COLORS["poor"],
+    }
+
+    # 2x2 layout positions
+    _BOX_POSITIONS = (
+        (Inches(0.5), Inches(1.2)),  # Top left
+        (Inches(5.2), Inches(1.2)),  # Top right
+        (Inches(0.5), Inches(4.2)),  # Bottom left
+        (Inches(5.2), Inches(4.2)),  # Bottom right
+    )
+
+    # Fixed team slide geometry, converted to EMU once
+    _TEAM_TITLE_BOX = (Inches(0.5), Inches(0.2), Inches(9), Inches(0.6))
+    _TEAM_TITLE_SIZE = Pt(32)
+    _HEALTH_CIRCLE_BOX = (Inches(8.5), Inches(0.25), Inches(0.5), Inches(0.5))
+    _BOX_WIDTH = Inches(4.3)
+    _BOX_HEIGHT = Inches(2.8)
+    _BOX_LINE_WIDTH = Pt(1)
+    _BOX_TITLE_SIZE = Pt(14)
+    _BULLET_SIZE = Pt(11)
+    _BULLET_SPACE = Pt(4)
+
+    # Box contents, relative to the box's top left corner and size
+    _BOX_TITLE_LEFT = Inches(0.2)
+    _BOX_TITLE_TOP = Inches(0.1)
+    _BOX_TITLE_MARGIN = Inches(0.4)
+    _BOX_TITLE_HEIGHT = Inches(0.4)
+    _BOX_CIRCLE_RIGHT = Inches(0.7)
+    _BOX_CIRCLE_TOP = Inches(0.15)
+    _BOX_CIRCLE_SIZE = Inches(0.5)
+    _BOX_BULLETS_LEFT = Inches(0.1)
+    _BOX_BULLETS_TOP = Inches(0.6)
+    _BOX_BULLETS_MARGIN = Inches(0.2)
+    _BOX_BULLETS_BOTTOM = Inches(0.7)
+
+    def __init__(self, provider: str, api_key: str, model: str, cache_dir: Optional[str] = None):
         """Initialize with LLM provider configuration."""
         self.prs = Presentation()
         self.prs.slide_width = Inches(10)
         self.prs.slide_height = Inches(7.5)
-        self.llm_generator = LLMSummaryGenerator(provider, api_key, model)
+        self.llm_generator = LLMSummaryGenerator(provider, api_key, model, cache_dir)
 
     def generate_presentation(
         self,
@@ -44,22 +86,39 @@ class PowerPointGenerator:
         all_sprint_data: List[Dict[str, Any]],
         all_metrics: List[Dict[str, Any]],
         output_dir: str = "./output",
+        slide_contents: Optional[List[Dict[str, Any]]] = None,
     ):
-        """Generate PowerPoint presentation with LLM-powered content."""
+        """Generate PowerPoint presentation with LLM-powered content.
+
+        Args:
+            all_summaries: Sprint summaries, one per team
+            all_sprint_data: Raw sprint data, one per team
+            all_metrics: Calculated metrics, one per team
+            output_dir: Directory to write the presentation to
+            slide_contents: Optional pre-generated slide content per team; missing
+                content is generated here with one concurrent LLM call per team
+        """
+        # Generate missing slide content up front; python-pptx is not thread-safe,
+        # so the slides themselves are still built serially below
+        slide_contents = fill_slide_contents(all_summaries, slide_contents, self.llm_generator.generate_slide_content)
+
         # Add title slide
         self._create_title_slide(all_summaries)
 
         # Add slide for each team
-        for i, (summary, sprint_data, metrics) in enumerate(zip(all_summaries, all_sprint_data, all_metrics)):
-            print(f"   🤖 Generating AI slide content for {summary['teamInfo']['label']}...")
-            self._create_team_slide(summary, sprint_data, metrics)
+        for summary, sprint_data, metrics, llm_content in zip(all_summaries, all_sprint_data, all_metrics, slide_contents):
+            self._create_team_slide(summary, sprint_data, metrics, llm_content)
 
         # Save presentation
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         file_path = output_path / "sprint-summary-presentation.pptx"
 
-        self.prs.save(str(file_path))
+        # Serialize in memory, then write the file in one go instead of many small zip
+        # writes; the temp file is renamed into place so readers never see a partial deck
+        buffer = io.BytesIO()
+        self.prs.save(buffer)
+        atomic_write_bytes(file_path, buffer.getbuffer())
         print(f"   ✅ PowerPoint saved to: {file_path}")
 
     def _create_title_slide(self, all_summaries: List[Dict[str, Any]]):
@@ -133,6 +192,7 @@ class PowerPointGenerator:
         summary: Dict[str, Any],
         sprint_data: Dict[str, Any],
         metrics: Dict[str, Any],
+        llm_content: Optional[Dict[str, Any]] = None,
     ):
         """Create a slide for a specific team with 2x2 layout."""
         blank_layout = self.prs.slide_layouts[6]
@@ -143,36 +203,29 @@ class PowerPointGenerator:
         health = summary["sprintHealthMetrics"]["overallHealth"]
 
         # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.2), Inches(9), Inches(0.6))
+        title_box = slide.shapes.add_textbox(*self._TEAM_TITLE_BOX)
         title_frame = title_box.text_frame
         title_frame.text = f"Team: {team_label} ({project_key})"
         title_para = title_frame.paragraphs[0]
-        title_para.font.size = Pt(32)
+        title_para.font.size = self._TEAM_TITLE_SIZE
         title_para.font.bold = True
         title_para.font.color.rgb = self.COLORS["dark_gray"]
 
         # Health indicator next to title
         health_color = self._get_health_color(health)
-        health_circle = slide.shapes.add_shape(
-            MSO_SHAPE.OVAL,
-            Inches(8.5), Inches(0.25), Inches(0.5), Inches(0.5)
-        )
+        health_circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, *self._HEALTH_CIRCLE_BOX)
         health_circle.fill.solid()
         health_circle.fill.fore_color.rgb = health_color
 
         # Get LLM-generated content using the summary which already has all the data
-        llm_content = self.llm_generator.generate_slide_content(summary)
-
-        # 2x2 layout positions
-        positions = [
-            (Inches(0.5), Inches(1.2)),  # Top left
-            (Inches(5.2), Inches(1.2)),  # Top right
-            (Inches(0.5), Inches(4.2)),  # Bottom left
-            (Inches(5.2), Inches(4.2)),  # Bottom right
-        ]
+        if llm_content is None:
+            llm_content = self.llm_generator.generate_slide_content(summary)
 
-        box_width = Inches(4.3)
-        box_height = Inches(2.8)
+        positions = self._BOX_POSITIONS
+        box_width = self._BOX_WIDTH
+        box_height = self._BOX_HEIGHT
+        box_fill = self.COLORS["light_gray"]
+        box_border = self.COLORS["border"]
 
         # Top Left: Health Summary
         self._add_enhanced_box(
@@ -183,8 +236,8 @@ class PowerPointGenerator:
             box_height,
             llm_content["healthSummary"]["title"],
             llm_content["healthSummary"]["bullets"],
-            self.COLORS["light_gray"],
-            self.COLORS["border"],
+            box_fill,
+            box_border,
             health_indicator=health_color,
         )
 
@@ -197,8 +250,8 @@ class PowerPointGenerator:
             box_height,
             llm_content["accomplishments"]["title"],
             llm_content["accomplishments"]["bullets"],
-            self.COLORS["light_gray"],
-            self.COLORS["border"],
+            box_fill,
+            box_border,
         )
 
         # Bottom Left: Blockers
@@ -215,8 +268,8 @@ class PowerPointGenerator:
             box_height,
             llm_content["blockers"]["title"],
             llm_content["blockers"]["bullets"],
-            self.COLORS["light_gray"],
-            self.COLORS["border"],
+            box_fill,
+            box_border,
             text_color=blocker_color,
         )
 
@@ -229,8 +282,8 @@ class PowerPointGenerator:
             box_height,
             llm_content["recommendations"]["title"],
             llm_content["recommendations"]["bullets"],
-            self.COLORS["light_gray"],
-            self.COLORS["border"],
+            box_fill,
+            box_border,
         )
 
     def _add_enhanced_box(
@@ -253,16 +306,19 @@ class PowerPointGenerator:
         box.fill.solid()
         box.fill.fore_color.rgb = fill_color
         box.line.color.rgb = border_color
-        box.line.width = Pt(1)
+        box.line.width = self._BOX_LINE_WIDTH
 
         # Title
         title_box = slide.shapes.add_textbox(
-            left + Inches(0.2), top + Inches(0.1), width - Inches(0.4), Inches(0.4)
+            left + self._BOX_TITLE_LEFT,
+            top + self._BOX_TITLE_TOP,
+            width - self._BOX_TITLE_MARGIN,
+            self._BOX_TITLE_HEIGHT,
         )
         title_frame = title_box.text_frame
         title_frame.text = title
         title_para = title_frame.paragraphs[0]
-        title_para.font.size = Pt(14)
+        title_para.font.size = self._BOX_TITLE_SIZE
         title_para.font.bold = True
         title_para.font.color.rgb = self.COLORS["dark_gray"]
 
@@ -270,25 +326,26 @@ class PowerPointGenerator:
         if health_indicator:
             circle = slide.shapes.add_shape(
                 MSO_SHAPE.OVAL,
-                left + width - Inches(0.7),
-                top + Inches(0.15),
-                Inches(0.5),
-                Inches(0.5),
+                left + width - self._BOX_CIRCLE_RIGHT,
+                top + self._BOX_CIRCLE_TOP,
+                self._BOX_CIRCLE_SIZE,
+                self._BOX_CIRCLE_SIZE,
             )
             circle.fill.solid()
             circle.fill.fore_color.rgb = health_indicator
 
         # Bullets
         bullets_box = slide.shapes.add_textbox(
-            left + Inches(0.1),
-            top + Inches(0.6),
-            width - Inches(0.2),
-            height - Inches(0.7),
+            left + self._BOX_BULLETS_LEFT,
+            top + self._BOX_BULLETS_TOP,
+            width - self._BOX_BULLETS_MARGIN,
+            height - self._BOX_BULLETS_BOTTOM,
         )
         bullets_frame = bullets_box.text_frame
         bullets_frame.word_wrap = True
         bullets_frame.vertical_anchor = MSO_ANCHOR.TOP
 
+        bullet_color = text_color if text_color else self.COLORS["text"]
         for i, bullet in enumerate(bullets):
             if i == 0:
                 p = bullets_frame.paragraphs[0]
@@ -296,18 +353,10 @@ class PowerPointGenerator:
                 p = bullets_frame.add_paragraph()
 
             p.text = f"• {bullet}"
-            p.font.size = Pt(11)
-            p.font.color.rgb = text_color if text_color else self.COLORS["text"]
-            p.space_before = Pt(4) if i > 0 else Pt(0)
+            p.font.size = self._BULLET_SIZE
+            p.font.color.rgb = bullet_color
+            p.space_before = self._BULLET_SPACE if i > 0 else Pt(0)
 
     def _get_health_color(self, health: str) -> RGBColor:
         """Get color for health status."""
-        health_lower = health.lower()
-        if health_lower == "good":
-            return self.COLORS["good"]
-        elif health_lower == "fair":
-            return self.COLORS["fair"]
-        elif health_lower == "poor":
-            return self.COLORS["poor"]
-        else:
-            return self.COLORS["gray"]
+        return self._HEALTH_COLOR_MAP.get(health.lower(), self.COLORS["gray"])
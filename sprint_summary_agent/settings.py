@@ -1,7 +1,8 @@
 """Configuration management using pydantic-settings."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -28,12 +29,15 @@ class Settings(BaseSettings):
 
     # Output Configuration
     generate_combined_summary: bool = Field(default=True, description="Generate combined summary")
+    generate_powerpoint: bool = Field(default=True, description="Generate PowerPoint presentation")
     output_dir: str = Field(default="./output", description="Output directory path")
 
     # LLM Configuration
     llm_provider: str = Field(default="openrouter", description="LLM provider (openai, anthropic, openrouter)")
     llm_api_key: Optional[str] = Field(default=None, description="LLM API key")
     llm_model: Optional[str] = Field(default=None, description="LLM model name")
+    llm_cache: bool = Field(default=True, description="Cache LLM responses for identical prompts")
+    llm_cache_dir: str = Field(default=".cache/llm", description="Directory for cached LLM responses")
 
     @field_validator("jira_host")
     @classmethod
@@ -54,13 +58,11 @@ class Settings(BaseSettings):
 
     def get_project_keys(self) -> List[str]:
         """Get list of project keys."""
-        return [k.strip() for k in self.jira_project_keys.split(",") if k.strip()]
+        return list(_split_comma_list(self.jira_project_keys))
 
     def get_team_labels(self) -> List[str]:
         """Get list of team labels."""
-        if not self.team_labels:
-            return []
-        return [t.strip() for t in self.team_labels.split(",") if t.strip()]
+        return list(_split_comma_list(self.team_labels))
 
     def get_jira_config(self) -> dict:
         """Get Jira client configuration."""
@@ -76,6 +78,7 @@ class Settings(BaseSettings):
             "provider": self.llm_provider,
             "api_key": self.llm_api_key,
             "model": self.llm_model,
+            "cache_dir": self.llm_cache_dir if self.llm_cache else None,
         }
 
 
@@ -94,3 +97,12 @@ def load_settings() -> Settings:
         if "jira_host" in str(e).lower() or "jira_email" in str(e).lower() or "jira_api_token" in str(e).lower():
             error_msg += "\nMake sure to set JIRA_HOST, JIRA_EMAIL, and JIRA_API_TOKEN in your .env file"
         raise ValueError(error_msg) from e
+
+
+@lru_cache(maxsize=None)
+def _split_comma_list(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated setting into its non-empty, stripped items.
+
+    Cached per string, so repeated getter calls don't re-parse the setting.
+    """
+    return tuple(item for item in (part.strip() for part in value.split(",")) if item)
@@ -0,0 +1,42 @@
+"""Slide content generation shared by the PowerPoint generators."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+# Upper bound on concurrent LLM calls when generating slide content
+MAX_SLIDE_WORKERS = 8
+
+
+def fill_slide_contents(
+    all_summaries: List[Dict[str, Any]],
+    slide_contents: Optional[List[Optional[Dict[str, Any]]]],
+    generate: Callable[[Dict[str, Any]], Dict[str, Any]],
+    generate_batch: Optional[Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]] = None,
+) -> List[Dict[str, Any]]:
+    """Generate slide content for teams that have none yet.
+
+    Args:
+        all_summaries: Sprint summaries, one per team
+        slide_contents: Pre-generated slide content per team, None where missing
+        generate: Generates one team's content; called concurrently
+        generate_batch: Generates every missing team's content as one batch job;
+            used instead of generate when given
+
+    Returns:
+        Slide content for every team, in the order of all_summaries
+    """
+    if slide_contents is None:
+        slide_contents = [None] * len(all_summaries)
+    missing = [summary for summary, content in zip(all_summaries, slide_contents) if content is None]
+    if not missing:
+        return list(slide_contents)
+
+    if generate_batch is not None:
+        print(f"   🤖 Generating AI slide content for {len(missing)} team(s) as one batch job...")
+        generated = iter(generate_batch(missing))
+    else:
+        for summary in missing:
+            print(f"   🤖 Generating AI slide content for {summary['teamInfo']['label']}...")
+        with ThreadPoolExecutor(max_workers=min(MAX_SLIDE_WORKERS, len(missing))) as executor:
+            generated = iter(list(executor.map(generate, missing)))
+    return [content if content is not None else next(generated) for content in slide_contents]
@@ -1,10 +1,25 @@
 """Sprint Data Collector - Gathers and organizes sprint-related data from Jira."""
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
+import heapq
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .datetime_utils import parse_timestamp
 from .jira_client import JiraClient
 
+logger = logging.getLogger(__name__)
+
+# Teams (or projects) collected at once; each collection fans out up to
+# jira_client.MAX_WORKERS requests of its own, so this keeps the total within
+# the Jira session's connection pool
+MAX_CONCURRENT_COLLECTIONS = 4
+
+# Sort rank of Jira priorities for accomplishments; anything else ranks after Lowest
+_PRIORITY_ORDER = {"Highest": 0, "High": 1, "Medium": 2, "Low": 3, "Lowest": 4}
+
 
 class SprintDataCollector:
     """Gathers and organizes all sprint-related data from Jira."""
@@ -17,7 +32,7 @@ class SprintDataCollector:
         self, project_keys: List[str], team_label: str
     ) -> Dict[str, Any]:
         """Collect sprint data for a specific team across projects."""
-        print(f"Fetching sprint data for team {team_label} across projects: {', '.join(project_keys)}...")
+        logger.info("Fetching sprint data for team %s across projects: %s...", team_label, ", ".join(project_keys))
 
         # Get the last closed sprint for this team across all projects
         result = self.jira_client.get_last_closed_sprint_for_team(project_keys, team_label)
@@ -26,18 +41,21 @@ class SprintDataCollector:
         board_name = result["boardName"]
         project_key = result["projectKey"]
 
-        print(f"Found closed sprint: {sprint['name']} ({project_key} - {board_name})")
+        logger.info("Found closed sprint: %s (%s - %s)", sprint["name"], project_key, board_name)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Get project info while the sprint issues are fetched
+            project_future = executor.submit(self.jira_client.get_project, project_key)
 
-        # Get all issues in the sprint (filtered by team label)
-        issues = self.jira_client.get_sprint_issues(sprint["id"], team_label)
-        print(f"Found {len(issues)} issues in sprint for team {team_label}")
+            # Get all issues in the sprint (filtered by team label)
+            issues = self.jira_client.get_sprint_issues(sprint["id"], team_label)
+            logger.info("Found %d issues in sprint for team %s", len(issues), team_label)
 
-        # Get team members
-        team_members = self.jira_client.get_sprint_team_members(issues)
-        print(f"Found {len(team_members)} team members")
+            # Get team members
+            team_members = self.jira_client.get_sprint_team_members(issues)
+            logger.info("Found %d team members", len(team_members))
 
-        # Get project info
-        project = self.jira_client.get_project(project_key)
+            project = project_future.result()
 
         return {
             "sprint": sprint,
@@ -55,25 +73,28 @@ class SprintDataCollector:
     ) -> Dict[str, Any]:
         """Collect sprint data for a specific project and team."""
         team_info = f" for team {team_label}" if team_label else ""
-        print(f"Fetching sprint data from project {project_key}{team_info}...")
+        logger.info("Fetching sprint data from project %s%s...", project_key, team_info)
 
         # Get the last closed sprint
         result = self.jira_client.get_last_closed_sprint(project_key, team_label)
         sprint = result["sprint"]
         board_id = result["boardId"]
 
-        print(f"Found closed sprint: {sprint['name']}")
+        logger.info("Found closed sprint: %s", sprint["name"])
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Get project info while the sprint issues are fetched
+            project_future = executor.submit(self.jira_client.get_project, project_key)
 
-        # Get all issues in the sprint
-        issues = self.jira_client.get_sprint_issues(sprint["id"], team_label)
-        print(f"Found {len(issues)} issues in sprint{team_info}")
+            # Get all issues in the sprint
+            issues = self.jira_client.get_sprint_issues(sprint["id"], team_label)
+            logger.info("Found %d issues in sprint%s", len(issues), team_info)
 
-        # Get team members
-        team_members = self.jira_client.get_sprint_team_members(issues)
-        print(f"Found {len(team_members)} team members")
+            # Get team members
+            team_members = self.jira_client.get_sprint_team_members(issues)
+            logger.info("Found %d team members", len(team_members))
 
-        # Get project info
-        project = self.jira_client.get_project(project_key)
+            project = project_future.result()
 
         return {
             "sprint": sprint,
@@ -93,33 +114,52 @@ class SprintDataCollector:
 
         # If no team labels specified, just get the latest sprint for each project
         if not team_labels:
-            print("No team labels provided - fetching latest sprint for each project without team filtering")
-
-            for project_key in project_keys:
-                try:
-                    sprint_data = self.collect_sprint_data(project_key, None)
-                    if sprint_data["issues"]:
-                        all_sprint_data.append(sprint_data)
-                    else:
-                        print(f"No issues found in latest sprint for project {project_key}, skipping...")
-                except Exception as e:
-                    print(f"Warning: Could not collect data for project {project_key}: {e}")
+            logger.info("No team labels provided - fetching latest sprint for each project without team filtering")
 
-            return all_sprint_data
-
-        # Process each team - find their sprint across all projects
-        for team_label in team_labels:
-            try:
-                sprint_data = self.collect_sprint_data_for_team(project_keys, team_label)
-                if sprint_data["issues"]:
+            results = _collect_concurrently(self.collect_sprint_data, project_keys)
+            for project_key, (sprint_data, error) in zip(project_keys, results):
+                if error is not None:
+                    logger.warning("Could not collect data for project %s: %s", project_key, error)
+                elif sprint_data["issues"]:
                     all_sprint_data.append(sprint_data)
                 else:
-                    print(f"No issues found for team {team_label}, skipping...")
-            except Exception as e:
-                print(f"Warning: Could not collect data for team {team_label}: {e}")
+                    logger.info("No issues found in latest sprint for project %s, skipping...", project_key)
+
+            return all_sprint_data
+
+        # Process each team - find their sprint across all projects. The first team
+        # fetches the board and sprint listings every team searches, so the rest
+        # run concurrently against the Jira client's cache.
+        collect_for_team = partial(self.collect_sprint_data_for_team, project_keys)
+        results = _collect_concurrently(collect_for_team, team_labels[:1])
+        results += _collect_concurrently(collect_for_team, team_labels[1:])
+        for team_label, (sprint_data, error) in zip(team_labels, results):
+            if error is not None:
+                logger.warning("Could not collect data for team %s: %s", team_label, error)
+            elif sprint_data["issues"]:
+                all_sprint_data.append(sprint_data)
+            else:
+                logger.info("No issues found for team %s, skipping...", team_label)
 
         return all_sprint_data
 
+    def summarize(self, sprint_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute metrics, health, accomplishments and blockers for a sprint.
+
+        The issues are walked once, by calculate_metrics; the remaining steps
+        only read the status groups it produces.
+
+        Returns:
+            Dictionary with "metrics", "healthAnalysis", "accomplishments" and "blockers"
+        """
+        metrics = self.calculate_metrics(sprint_data)
+        return {
+            "metrics": metrics,
+            "healthAnalysis": self.analyze_sprint_health(metrics),
+            "accomplishments": self.extract_accomplishments(metrics, sprint_data["issues"]),
+            "blockers": self.extract_blockers(metrics),
+        }
+
     def calculate_metrics(self, sprint_data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate sprint metrics."""
         issues = sprint_data["issues"]
@@ -136,19 +176,19 @@ class SprintDataCollector:
         # Story points and issue type tracking
         total_story_points = 0
         completed_story_points = 0
-        issue_types = {}
-        priorities = {}
+        issue_type_names = []
+        priority_names = []
 
         for issue in issues:
             fields = issue.get("fields", {})
-            status = fields.get("status", {}).get("statusCategory", {}).get("name", "").lower()
+            # Each nested object is looked up once and reused below
+            status_field = fields.get("status") or {}
+            priority_field = fields.get("priority")
+            status = (status_field.get("statusCategory") or {}).get("name", "").lower()
 
             # Try multiple common story points field IDs
             story_points = fields.get("customfield_20826") or fields.get("customfield_10016") or 0
 
-            issue_type = fields.get("issuetype", {}).get("name", "Unknown")
-            priority = fields.get("priority", {}).get("name") if fields.get("priority") else "None"
-
             # Track by status
             if status == "done":
                 status_groups["completed"].append(issue)
@@ -159,22 +199,18 @@ class SprintDataCollector:
                 status_groups["todo"].append(issue)
 
             # Check for blockers
-            labels = fields.get("labels", [])
-            status_name = fields.get("status", {}).get("name", "").lower()
-            if "blocked" in labels or "block" in status_name:
+            if "blocked" in fields.get("labels", []) or "block" in status_field.get("name", "").lower():
                 status_groups["blocked"].append(issue)
 
             total_story_points += story_points
 
-            # Track issue types
-            issue_types[issue_type] = issue_types.get(issue_type, 0) + 1
-
-            # Track priorities
-            priorities[priority] = priorities.get(priority, 0) + 1
+            # Track issue types and priorities (counted in one pass after the loop)
+            issue_type_names.append((fields.get("issuetype") or {}).get("name", "Unknown"))
+            priority_names.append(priority_field.get("name") if priority_field else "None")
 
         # Calculate dates and duration
-        start_date = datetime.fromisoformat(sprint["startDate"].replace("Z", "+00:00"))
-        end_date = datetime.fromisoformat(sprint["endDate"].replace("Z", "+00:00"))
+        start_date = parse_timestamp(sprint["startDate"])
+        end_date = parse_timestamp(sprint["endDate"])
         duration_days = (end_date - start_date).days
 
         # Calculate velocity based on issues (not story points)
@@ -200,8 +236,8 @@ class SprintDataCollector:
             "durationDays": duration_days,
             "startDate": sprint["startDate"],
             "endDate": sprint["endDate"],
-            "issueTypes": issue_types,
-            "priorities": priorities,
+            "issueTypes": dict(Counter(issue_type_names)),
+            "priorities": dict(Counter(priority_names)),
             "statusGroups": status_groups,
         }
 
@@ -287,27 +323,15 @@ class SprintDataCollector:
         """Extract key accomplishments."""
         completed_issues = metrics["statusGroups"]["completed"]
 
-        # Sort by priority
-        priority_order = {"Highest": 0, "High": 1, "Medium": 2, "Low": 3, "Lowest": 4}
-
-        sorted_completed = sorted(
-            completed_issues,
-            key=lambda x: priority_order.get(
-                x.get("fields", {}).get("priority", {}).get("name"), 5
-            ),
-        )[:10]
+        # Top 10 by priority (nsmallest keeps the original order among equal priorities)
+        sorted_completed = heapq.nsmallest(10, completed_issues, key=_priority_rank)
 
         accomplishments = []
         for issue in sorted_completed:
             fields = issue.get("fields", {})
-            accomplishments.append({
-                "key": issue.get("key"),
-                "summary": fields.get("summary", ""),
-                "type": fields.get("issuetype", {}).get("name", "Unknown"),
-                "priority": fields.get("priority", {}).get("name") if fields.get("priority") else "None",
-                "assignee": fields.get("assignee", {}).get("displayName", "Unassigned") if fields.get("assignee") else "Unassigned",
-                "storyPoints": fields.get("customfield_10016") or fields.get("customfield_20826") or 0,
-            })
+            accomplishment = _issue_details(issue.get("key"), fields)
+            accomplishment["storyPoints"] = fields.get("customfield_10016") or fields.get("customfield_20826") or 0
+            accomplishments.append(accomplishment)
 
         return accomplishments
 
@@ -316,13 +340,50 @@ class SprintDataCollector:
         blockers = []
         for issue in metrics["statusGroups"]["blocked"]:
             fields = issue.get("fields", {})
-            blockers.append({
-                "key": issue.get("key"),
-                "summary": fields.get("summary", ""),
-                "type": fields.get("issuetype", {}).get("name", "Unknown"),
-                "priority": fields.get("priority", {}).get("name") if fields.get("priority") else "None",
-                "assignee": fields.get("assignee", {}).get("displayName", "Unassigned") if fields.get("assignee") else "Unassigned",
-                "status": fields.get("status", {}).get("name", "Unknown"),
-            })
+            blocker = _issue_details(issue.get("key"), fields)
+            blocker["status"] = (fields.get("status") or {}).get("name", "Unknown")
+            blockers.append(blocker)
 
         return blockers
+
+
+def _collect_concurrently(
+    collect: Callable[[str], Dict[str, Any]], names: List[str]
+) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    """Run collect for each name on a thread pool.
+
+    Returns:
+        (sprint data, None) or (None, exception) per name, in the order of names
+    """
+    if not names:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_COLLECTIONS, len(names))) as executor:
+        futures = [executor.submit(collect, name) for name in names]
+
+    results = []
+    for future in futures:
+        try:
+            results.append((future.result(), None))
+        except Exception as e:
+            results.append((None, e))
+    return results
+
+
+def _priority_rank(issue: Dict[str, Any]) -> int:
+    """Sort rank of an issue's priority; missing or unknown priorities rank last."""
+    priority = issue.get("fields", {}).get("priority") or {}
+    return _PRIORITY_ORDER.get(priority.get("name"), len(_PRIORITY_ORDER))
+
+
+def _issue_details(key: Optional[str], fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten the display fields shared by accomplishments and blockers in one pass."""
+    priority = fields.get("priority")
+    assignee = fields.get("assignee")
+    return {
+        "key": key,
+        "summary": fields.get("summary", ""),
+        "type": (fields.get("issuetype") or {}).get("name", "Unknown"),
+        "priority": priority.get("name") if priority else "None",
+        "assignee": assignee.get("displayName", "Unassigned") if assignee else "Unassigned",
+    }